@@ -14,24 +14,62 @@ COMMON_IGNORES = {
     'dist', 'build', 'target', 'bin', 'obj', '__pycache__'
 }
 
-def get_git_tracked_files(repo_path):
-    """Returns a list of tracked markdown files relative to repo_path."""
+# Number of 'git ls-files' processes started ahead of the copy loop
+GIT_PREFETCH = 8
+
+# Bytes read from git's stdout at a time
+GIT_READ_CHUNK = 64 * 1024
+
+def start_git_ls_files(repo_path):
+    """Starts 'git ls-files' in repo_path without waiting. Returns the process, or None."""
     try:
         # -z handles filenames with spaces/newlines correctly
-        result = subprocess.run(
-            ['git', 'ls-files', '-z'], 
-            cwd=repo_path, 
-            capture_output=True, 
-            check=True
+        return subprocess.Popen(
+            ['git', 'ls-files', '-z'],
+            cwd=repo_path,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
-        # stdout is bytes, decode and split by null character
-        all_files = result.stdout.decode('utf-8', errors='ignore').split('\0')
-        # Filter for non-empty strings and markdown extensions
-        return [f for f in all_files if f and f.lower().endswith('.md')]
     except Exception as e:
         print(f"Warning: Failed to run git in {repo_path}: {e}")
         return None
 
+def iter_git_tracked_files(proc):
+    """
+    Yields tracked markdown files from a started git process as its output arrives,
+    so copying can begin before git finishes. Check proc.returncode once exhausted.
+    """
+    carry = b''
+    for chunk in iter(lambda: proc.stdout.read1(GIT_READ_CHUNK), b''):
+        *paths, carry = (carry + chunk).split(b'\0')
+        # Filter on the raw bytes so only markdown paths get decoded
+        for f in paths:
+            if f.lower().endswith(b'.md'):
+                yield f.decode('utf-8', errors='ignore')
+    if carry.lower().endswith(b'.md'):
+        yield carry.decode('utf-8', errors='ignore')
+    proc.stdout.close()
+    proc.wait()
+
+def copy_files(rel_paths, repo_path, dest_repo):
+    """Copies rel_paths from repo_path into dest_repo. Returns (files copied, errors)."""
+    files_copied = 0
+    errors = 0
+    for rel_path in rel_paths:
+        source_file = os.path.join(repo_path, rel_path)
+        dest_file = os.path.join(dest_repo, rel_path)
+        dest_dir = os.path.dirname(dest_file)
+        
+        try:
+            os.makedirs(dest_dir, exist_ok=True)
+            shutil.copy2(source_file, dest_file)
+            files_copied += 1
+        except Exception as e:
+            print(f"Error copying {rel_path}: {e}")
+            errors += 1
+    return files_copied, errors
+
 def extract_markdown_files(source_root, dest_root):
     """
     Scans source_root for repositories and copies all .md files to dest_root.
@@ -57,20 +95,43 @@ def extract_markdown_files(source_root, dest_root):
 
     print(f"Found {len(repos)} potential repositories.")
 
+    # Keep a few git processes running ahead so their startup overlaps the copy loop
+    git_repos = iter([r for r in repos if os.path.exists(os.path.join(source_root, r, '.git'))])
+    git_procs = {}
+
+    def start_next_git():
+        repo = next(git_repos, None)
+        if repo is not None:
+            git_procs[repo] = start_git_ls_files(os.path.join(source_root, repo))
+
+    for _ in range(GIT_PREFETCH):
+        start_next_git()
+
     for repo in repos:
         repo_path = os.path.join(source_root, repo)
-        files_to_copy = []
+        dest_repo = os.path.join(dest_root, repo)
         
         # Check if it's a git repo
-        is_git_repo = os.path.exists(os.path.join(repo_path, '.git'))
+        is_git_repo = repo in git_procs
         
         if is_git_repo:
             print(f"Scanning Git repo: {repo}")
-            files_to_copy = get_git_tracked_files(repo_path)
+            proc = git_procs.pop(repo)
+            start_next_git()
             
+            if proc is not None:
+                # Copy while git is still listing; only counted once git exits cleanly,
+                # since the fallback walk below copies (and counts) the same files again
+                copied, failed = copy_files(iter_git_tracked_files(proc), repo_path, dest_repo)
+                if proc.returncode == 0:
+                    files_copied += copied
+                    errors += failed
+
             # Fallback if git command failed for some reason
-            if files_to_copy is None:
-                is_git_repo = False 
+            if proc is None or proc.returncode != 0:
+                if proc is not None:
+                    print(f"Warning: Failed to run git in {repo_path}: exit code {proc.returncode}")
+                is_git_repo = False
 
         if not is_git_repo:
             print(f"Scanning Directory (Non-Git): {repo}")
@@ -89,20 +150,9 @@ def extract_markdown_files(source_root, dest_root):
                         except ValueError:
                             continue
 
-        # Copy the identified files
-        if files_to_copy:
-            for rel_path in files_to_copy:
-                source_file = os.path.join(repo_path, rel_path)
-                dest_file = os.path.join(dest_root, repo, rel_path)
-                dest_dir = os.path.dirname(dest_file)
-                
-                try:
-                    os.makedirs(dest_dir, exist_ok=True)
-                    shutil.copy2(source_file, dest_file)
-                    files_copied += 1
-                except Exception as e:
-                    print(f"Error copying {rel_path}: {e}")
-                    errors += 1
+            copied, failed = copy_files(files_to_copy, repo_path, dest_repo)
+            files_copied += copied
+            errors += failed
 
     end_time = datetime.now()
     duration = end_time - start_time
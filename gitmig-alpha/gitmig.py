@@ -22,7 +22,14 @@ Options:
   --only        : Only migrate specific repos (comma-separated).
   --force       : Overwrite existing files without warning.
   --stats-all   : Show all file extensions in stats (not just top 15).
-  --skip-existing : Skip files that already exist at destination.
+  --skip-existing : Skip files that already exist at destination with the same size.
+  --jobs, -j    : Number of files to copy concurrently.
+  --compress-method : Zip compression method (deflate, zstd, store).
+  --compress-level  : Zip compression level (default: 1, fastest).
+  --repo-jobs   : Process this many repos in parallel worker processes.
+  --link        : Place files by copy (default), hard link, or reflink clone.
+  --incremental : Skip repos unchanged since the last run.
+  --dedup       : Hard-link files with identical content instead of copying again.
 
 Commands:
     # Copy all repos from current directory to destination
@@ -49,22 +56,373 @@ Commands:
 """
 
 import argparse
-import fnmatch
+import errno
+import hashlib
+import json
+import multiprocessing
 import os
+import queue
 import shutil
+import stat
+import subprocess
 import sys
+import threading
 import time
 import zipfile
-from collections import defaultdict
-from typing import List, Tuple, Dict, Optional
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, List, Tuple, Dict, Optional, Set
+
+try:
+    import fcntl  # Unix only; used for reflink clones
+except ImportError:
+    fcntl = None
 
 # --- IMPORT CONFIG ---
 try:
-    from gitmig_config import EXCLUDE_DIRS, EXCLUDE_FILE_PATTERNS, PRESERVE_PATTERNS, Colors
+    from gitmig_config import (
+        EXCLUDE_DIRS, EXCLUDE_FILE_PATTERNS, Colors, FOLD_CASE, compile_patterns,
+        EXCLUDE_DIRS_LITERAL, EXCLUDE_DIRS_GLOB_SUFFIXES, EXCLUDE_DIRS_GLOB_RE,
+        EXCLUDE_FILE_LITERAL, EXCLUDE_FILE_SUFFIXES, EXCLUDE_FILE_RE,
+        PRESERVE_LITERAL, PRESERVE_SUFFIXES, PRESERVE_RE,
+    )
 except ImportError:
     print("Error: gitmig_config.py not found. Please ensure it is in the same directory.")
     sys.exit(1)
 
+# Scan results. The lstat taken while scanning is kept (None if it failed) so
+# copies don't stat the source again.
+ScannedFile = Tuple[str, str, int, Optional[os.stat_result]]  # (rel path, name, size, lstat)
+FileToCopy = Tuple[str, int, Optional[os.stat_result]]  # (rel path, size, lstat)
+ExcludedDir = Tuple[str, str]  # (folder name, full path)
+RepoState = Tuple[str, List[list]]  # --incremental: (HEAD commit, [rel path, size, mtime] of ignored files)
+
+
+# =============================================================================
+# Tuning
+# =============================================================================
+
+# Directories listed concurrently during a scan. Each listing mostly waits on
+# the filesystem (slow on network/mapped drives), so this can exceed CPU count.
+SCAN_WORKERS = 32
+
+# Paths per os.lstat task when sizing files listed by git, so thread-pool
+# overhead is paid per batch rather than per file.
+STAT_BATCH = 512
+
+# Repos scanned ahead of the one being copied (serial mode).
+SCAN_PREFETCH = 2
+
+# Default number of files copied concurrently (override with --jobs).
+DEFAULT_COPY_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Buffer size for the userspace copy fallback.
+COPY_BUFSIZE = 1024 * 1024
+
+# How files are placed at the destination (--link).
+LINK_MODES = ["copy", "hard", "reflink"]
+
+# Source files at least this big get sequential read-ahead and are dropped from
+# the page cache afterwards (a migration reads each file once). Below this the
+# two extra posix_fadvise calls cost more than they save.
+FADVISE_MIN_SIZE = 1024 * 1024
+
+# --dedup only hashes files up to this size; bigger ones are rarely shared
+# boilerplate, and each is held in memory while it is hashed and written.
+DEDUP_MAX_SIZE = 1024 * 1024
+
+# Linux ioctl that clones a file's extents on CoW filesystems (btrfs, XFS).
+FICLONE = 0x40049409
+
+# --incremental state, kept in the destination directory.
+CACHE_FILE = ".gitmig_cache.json"
+CACHE_MAX_REPOS = 500  # Least recently used entries beyond this are dropped
+
+# 'git ls-files' arguments for the index fast path: tracked + untracked files,
+# then ignored entries (ignored directories collapsed to a single "dir/" line).
+GIT_LIST_ARGS = ["--cached", "--others", "--exclude-standard"]
+GIT_IGNORED_ARGS = ["--others", "--ignored", "--exclude-standard", "--directory"]
+# How often a racing git listing checks whether the walk has already won (seconds).
+GIT_CANCEL_POLL = 0.05
+
+# Zip compression methods (--compress-method). ZIP_ZSTANDARD needs Python 3.14+.
+COMPRESS_METHODS = {
+    "deflate": zipfile.ZIP_DEFLATED,
+    "zstd": getattr(zipfile, "ZIP_ZSTANDARD", None),
+    "store": zipfile.ZIP_STORED,
+}
+
+# Fast compression is a better tradeoff than zlib's default (6) for backups.
+DEFAULT_COMPRESS_LEVEL = 1
+
+# Zip read-ahead: files read by copy workers but not yet written to the archive.
+ZIP_READAHEAD_BYTES = 64 * 1024 * 1024
+
+# Copies queued ahead per --jobs worker: enough to keep workers busy between
+# results, few enough that Ctrl-C doesn't leave thousands of copies to drain.
+COPY_AHEAD_PER_JOB = 4
+
+# Already-compressed formats are stored as-is; compressing them again costs
+# CPU for no size gain.
+INCOMPRESSIBLE_EXTS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico",
+    ".mp3", ".mp4", ".mov", ".webm", ".pdf", ".woff", ".woff2",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".zst", ".jar", ".whl",
+})
+
+# Files above this size are streamed into the zip in COPY_BUFSIZE chunks;
+# smaller ones are read whole and compressed in a single zlib call.
+ZIP_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+
+# =============================================================================
+# File Copy
+# =============================================================================
+
+
+def _kernel_copy(copy_chunk, blocksize: int, size: int) -> bool:
+    """
+    Drive an in-kernel copy function until EOF.
+    Returns False if it failed before copying anything (caller should fall back).
+    """
+    copied = 0
+    while True:
+        try:
+            n = copy_chunk(copied, blocksize)
+        except OSError as e:
+            # Only give up cleanly if nothing was written yet
+            if copied or e.errno == errno.ENOSPC:
+                raise
+            return False
+        if n == 0:
+            # Some filesystems (procfs, FUSE, older kernels across mounts) report
+            # 0 straight away for a non-empty file; that is not a real EOF
+            return bool(copied) or not size
+        copied += n
+
+
+def _copy_data(infd: int, outfd: int, size: int, reflink: bool = False) -> None:
+    """
+    Copy file contents between descriptors. Tries a FICLONE reflink (if requested),
+    copy_file_range (server-side/CoW clones on NFS, btrfs, XFS), then sendfile,
+    then a 1 MiB read/write loop.
+    """
+    if reflink and fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.ioctl(outfd, FICLONE, infd)
+            return
+        except OSError:
+            pass  # Not a CoW filesystem or different volumes; copy normally
+
+    blocksize = min(max(size, 1 << 23), 1 << 30)
+    if hasattr(os, "copy_file_range"):
+        if _kernel_copy(lambda off, n: os.copy_file_range(infd, outfd, n, off, off), blocksize, size):
+            return
+    if hasattr(os, "sendfile"):
+        if _kernel_copy(lambda off, n: os.sendfile(outfd, infd, off, n), blocksize, size):
+            return
+    while True:
+        buf = os.read(infd, COPY_BUFSIZE)
+        if not buf:
+            return
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(outfd, view):]
+
+
+# Raw descriptors avoid the extra fstat() that open() does on every file
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | _O_BINARY
+_UTIME_FD = os.utime in os.supports_fd
+_HAS_FCHMOD = hasattr(os, "fchmod")
+_HAS_FADVISE = hasattr(os, "posix_fadvise")  # Not on Windows or macOS
+
+
+def _fadvise(fd: int, advice: int) -> None:
+    """Best-effort posix_fadvise over the whole file."""
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _open_dst(dst: str) -> Tuple[int, str]:
+    """
+    Open dst for writing, creating or truncating it.
+    Returns: (descriptor, "copied" if dst was created or "overwritten" if it existed)
+    """
+    # O_EXCL creation doubles as the existence check
+    try:
+        return os.open(dst, _WRITE_FLAGS | os.O_EXCL, 0o666), "copied"
+    except FileExistsError:
+        pass
+    if os.lstat(dst).st_nlink > 1:
+        # A hard link (e.g. from --link hard or --dedup): writing in place would
+        # change every other name for the file, possibly the source, so replace it
+        os.unlink(dst)
+        return os.open(dst, _WRITE_FLAGS | os.O_EXCL, 0o666), "overwritten"
+    return os.open(dst, _WRITE_FLAGS | os.O_TRUNC, 0o666), "overwritten"
+
+
+def _write_file(dst: str, data: bytes, st: os.stat_result) -> str:
+    """
+    Write data already read from a source to dst, with the source's permissions
+    and timestamps from st.
+    Returns: "copied" if dst was created, "overwritten" if it already existed
+    """
+    outfd, status = _open_dst(dst)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(outfd, view):]
+        if _UTIME_FD:
+            os.utime(outfd, ns=(st.st_atime_ns, st.st_mtime_ns))
+        if _HAS_FCHMOD:
+            os.fchmod(outfd, stat.S_IMODE(st.st_mode))
+    finally:
+        os.close(outfd)
+
+    if not _UTIME_FD:
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    if not _HAS_FCHMOD:
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+    return status
+
+
+def _fastcopy(src: str, dst: str, reflink: bool = False, st: Optional[os.stat_result] = None) -> str:
+    """
+    Copy src to dst with its permissions and timestamps. st is the source's
+    stat from the scan; without it, one fstat serves both the copy and the metadata.
+    Returns: "copied" if dst was created, "overwritten" if it already existed
+    """
+    infd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        if st is None:
+            st = os.fstat(infd)
+        outfd, status = _open_dst(dst)
+        advise = _HAS_FADVISE and st.st_size >= FADVISE_MIN_SIZE
+        try:
+            if advise:
+                _fadvise(infd, os.POSIX_FADV_SEQUENTIAL)
+            _copy_data(infd, outfd, st.st_size, reflink)
+            if advise:
+                _fadvise(infd, os.POSIX_FADV_DONTNEED)
+            if _UTIME_FD:
+                os.utime(outfd, ns=(st.st_atime_ns, st.st_mtime_ns))
+            if _HAS_FCHMOD:
+                os.fchmod(outfd, stat.S_IMODE(st.st_mode))
+        finally:
+            os.close(outfd)
+    finally:
+        os.close(infd)
+
+    if not _UTIME_FD:
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    if not _HAS_FCHMOD:
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+    return status
+
+
+def _hardlink(src: str, dst: str) -> str:
+    """
+    Hard-link dst to src (no data is copied).
+    Returns: "copied" if dst was created, "overwritten" if it replaced a file
+    """
+    try:
+        os.link(src, dst)
+        return "copied"
+    except FileExistsError:
+        os.unlink(dst)
+        os.link(src, dst)
+        return "overwritten"
+
+
+def _zip_info(arc_name: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """
+    ZipInfo.from_file() without its os.stat(), from the stat taken during the scan.
+    Timestamps before 1980 (not representable in zip) are clamped like strict_timestamps=False.
+    """
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+    info = zipfile.ZipInfo(arc_name, date_time)
+    info.external_attr = (st.st_mode & 0xFFFF) << 16
+    info.file_size = st.st_size
+    return info
+
+
+def _ancestors(path: str) -> Iterator[str]:
+    """Yield path and each of its parent directories, deepest first."""
+    while True:
+        yield path
+        parent = os.path.dirname(path)
+        if not parent or parent == path:
+            return
+        path = parent
+
+
+def _matches(compiled: tuple, name: str) -> bool:
+    """
+    Match a name against compile_patterns() output. The caller case-folds the
+    name when FOLD_CASE is set.
+    """
+    literals, suffixes, regex = compiled
+    if name in literals:
+        return True
+    # Names without a required suffix (most of them) never reach the regex
+    if regex is None or (suffixes is not None and not name.endswith(suffixes)):
+        return False
+    return regex.match(name) is not None
+
+
+def _file_ext(name: str) -> str:
+    """Lowercase extension of a file name like os.path.splitext (leading dots don't count)."""
+    dot = name.rfind(".")
+    if dot > 0 and name[:dot].strip("."):
+        return name[dot:].lower()
+    return "(no ext)"
+
+
+def _new_extension_stat() -> Dict[str, int]:
+    """Default entry for extension_stats (module-level so engines can be pickled)."""
+    return {"count": 0, "bytes": 0}
+
+
+def _communicate_all(procs: List[subprocess.Popen], cancel: Optional[threading.Event]) -> Optional[List[bytes]]:
+    """
+    Collect each process's stdout. Once cancel is set, kill them all and return
+    None instead of letting a lost race keep listing the tree.
+    """
+    outputs = []
+    try:
+        for proc in procs:
+            while True:
+                try:
+                    outputs.append(proc.communicate(timeout=None if cancel is None else GIT_CANCEL_POLL)[0])
+                    break
+                except subprocess.TimeoutExpired:
+                    if cancel.is_set():
+                        return None
+        return outputs
+    finally:
+        if len(outputs) < len(procs):
+            for proc in procs:
+                proc.kill()
+                proc.wait()
+
+
+def _lstat_batch(paths: List[str]) -> List[Optional[os.stat_result]]:
+    """os.lstat a batch of paths; None for missing or unreadable ones."""
+    results: List[Optional[os.stat_result]] = []
+    for path in paths:
+        try:
+            results.append(os.lstat(path))
+        except OSError:
+            results.append(None)
+    return results
+
 
 # =============================================================================
 # Core Logic
@@ -88,6 +446,13 @@ class GitMigEngine:
         force: bool = False,
         stats_all: bool = False,
         skip_existing: bool = False,
+        jobs: Optional[int] = None,
+        compress_method: str = "deflate",
+        compress_level: Optional[int] = DEFAULT_COMPRESS_LEVEL,
+        repo_jobs: int = 1,
+        link_mode: str = "copy",
+        incremental: bool = False,
+        dedup: bool = False,
     ):
         self.source_dir = os.path.abspath(source_dir)
         self.dest_dir = os.path.abspath(dest_dir)
@@ -102,6 +467,18 @@ class GitMigEngine:
         self.force = force  # Overwrite without warning
         self.stats_all = stats_all  # Show all extensions, not just top 15
         self.skip_existing = skip_existing  # Skip files that already exist
+        self.jobs = jobs or DEFAULT_COPY_JOBS  # Concurrent file copies
+        self.compression = COMPRESS_METHODS[compress_method]  # Zip compression type
+        self.compress_level = compress_level
+        self.repo_jobs = repo_jobs  # Repos processed in parallel worker processes
+        self.link_mode = link_mode  # "copy", "hard" or "reflink"
+        self._same_volume: Optional[bool] = None  # Probed on first copy
+        self._pool: Optional[ThreadPoolExecutor] = None  # Copy/read workers, created on first use
+        self._made_dirs: set = set()  # Destination directories known to exist (ancestors included)
+        self.incremental = incremental  # Skip repos unchanged since the last run
+        self.dedup = dedup  # Hard-link copies of identical small files
+        self._blob_index: Dict[Tuple[bytes, int], str] = {}  # (content hash, mode) -> first destination path
+        self._blob_lock = threading.Lock()
         
         # Merge extra excludes
         self.exclude_dirs = list(EXCLUDE_DIRS)
@@ -118,21 +495,79 @@ class GitMigEngine:
         # Remove .git from exclusions if --include-git
         if self.include_git and ".git" in self.exclude_dirs:
             self.exclude_dirs.remove(".git")
+
+        # Defaults come precompiled from gitmig_config; recompile only when
+        # --exclude / --include-git changed the lists
+        if self.exclude_dirs == EXCLUDE_DIRS:
+            self._exclude_dirs = (EXCLUDE_DIRS_LITERAL, EXCLUDE_DIRS_GLOB_SUFFIXES, EXCLUDE_DIRS_GLOB_RE)
+        else:
+            self._exclude_dirs = compile_patterns(self.exclude_dirs)
+        if self.exclude_files == EXCLUDE_FILE_PATTERNS:
+            self._exclude_files = (EXCLUDE_FILE_LITERAL, EXCLUDE_FILE_SUFFIXES, EXCLUDE_FILE_RE)
+        else:
+            self._exclude_files = compile_patterns(self.exclude_files)
+        self._preserve = (PRESERVE_LITERAL, PRESERVE_SUFFIXES, PRESERVE_RE)
         
-        # Stats
+        self._reset_stats()
+
+    def __getstate__(self) -> dict:
+        """Pickle without the thread pool (engines are sent to --repo-jobs workers)."""
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        del state["_blob_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._blob_lock = threading.Lock()
+
+    def _reset_stats(self) -> None:
+        """Reset all run statistics."""
         self.repos_found: List[str] = []
         self.total_files_copied = 0
-        self.total_files_skipped = 0
+        self.total_files_skipped = 0  # Only counted with --stats
+        self.total_dirs_skipped = 0
         self.total_bytes_copied = 0
         self.preserved_files: List[str] = []  # Track .env files etc.
         self.symlinks_skipped = 0
         self.large_files_skipped = 0  # Files skipped due to --max-size
         self.files_overwritten = 0  # Files that already existed
         self.files_skipped_existing = 0  # Files skipped due to --skip-existing
+        self.files_deduplicated = 0  # Files hard-linked to an identical copy (--dedup)
+        self.repos_unchanged = 0  # Repos skipped by --incremental
+        self.failed_repos: List[str] = []  # Repos with copy/zip errors (not cached)
         self.start_time: float = 0
         
         # Detailed stats per extension
-        self.extension_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"count": 0, "bytes": 0})
+        self.extension_stats: Dict[str, Dict[str, int]] = defaultdict(_new_extension_stat)
+
+    def _repo_stats(self) -> dict:
+        """Statistics a worker process sends back to be merged by the parent."""
+        return {
+            "preserved_files": self.preserved_files,
+            "total_dirs_skipped": self.total_dirs_skipped,
+            "symlinks_skipped": self.symlinks_skipped,
+            "large_files_skipped": self.large_files_skipped,
+            "files_overwritten": self.files_overwritten,
+            "files_skipped_existing": self.files_skipped_existing,
+            "files_deduplicated": self.files_deduplicated,
+            "failed_repos": self.failed_repos,
+            "extension_stats": dict(self.extension_stats),
+        }
+
+    def _merge_repo_stats(self, stats: dict) -> None:
+        """Merge statistics returned by a worker process."""
+        self.preserved_files.extend(stats["preserved_files"])
+        self.total_dirs_skipped += stats["total_dirs_skipped"]
+        self.symlinks_skipped += stats["symlinks_skipped"]
+        self.large_files_skipped += stats["large_files_skipped"]
+        self.files_overwritten += stats["files_overwritten"]
+        self.files_skipped_existing += stats["files_skipped_existing"]
+        self.files_deduplicated += stats["files_deduplicated"]
+        self.failed_repos.extend(stats["failed_repos"])
+        for ext, ext_stats in stats["extension_stats"].items():
+            self.extension_stats[ext]["count"] += ext_stats["count"]
+            self.extension_stats[ext]["bytes"] += ext_stats["bytes"]
 
     def _print(self, message: str = "", style_color: str = None) -> None:
         """Print message unless in quiet mode."""
@@ -157,186 +592,673 @@ class GitMigEngine:
         """Find all git repositories (folders containing .git/) in source directory."""
         repos = []
         try:
-            for entry in sorted(os.listdir(self.source_dir)):
-                full_path = os.path.join(self.source_dir, entry)
-                git_path = os.path.join(full_path, ".git")
-                if os.path.isdir(full_path) and os.path.isdir(git_path):
-                    # Filter by --only if specified
-                    if self.only_repos and entry not in self.only_repos:
-                        continue
-                    repos.append(entry)
+            with os.scandir(self.source_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
         except PermissionError:
-            pass
+            return repos
+
+        for entry in entries:
+            # Filter by --only before any further syscalls
+            if self.only_repos and entry.name not in self.only_repos:
+                continue
+            # entry.is_dir() is served from the scandir result
+            if entry.is_dir() and os.path.isdir(os.path.join(entry.path, ".git")):
+                repos.append(entry.name)
         return repos
 
     def _should_exclude_dir(self, dirname: str) -> bool:
         """Check if a directory should be excluded."""
-        for pattern in self.exclude_dirs:
-            if fnmatch.fnmatch(dirname, pattern) or dirname == pattern:
-                return True
-        return False
+        return _matches(self._exclude_dirs, dirname.lower() if FOLD_CASE else dirname)
 
     def _should_exclude_file(self, filename: str) -> bool:
         """Check if a file should be excluded."""
-        for pattern in self.exclude_files:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+        return _matches(self._exclude_files, filename.lower() if FOLD_CASE else filename)
 
     def _should_preserve(self, filename: str) -> bool:
         """Check if a file should be preserved (override exclusion)."""
-        for pattern in PRESERVE_PATTERNS:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+        return _matches(self._preserve, filename.lower() if FOLD_CASE else filename)
 
-    def _scan_repo(self, repo_name: str) -> Tuple[List[Tuple[str, int]], Dict[str, int]]:
+    def _classify_file(self, filename: str) -> Optional[str]:
         """
-        Scan a repository and return files to copy and skip stats.
-        Returns: (list of (relative path, size) tuples, dict of skipped folder stats)
+        _should_preserve and _should_exclude_file in one call, case-folding once.
+        Returns: "preserve", "exclude", or None for a regular file to copy
         """
-        repo_path = os.path.join(self.source_dir, repo_name)
-        files_to_copy: List[Tuple[str, int]] = []  # (path, size)
-        skipped_stats: Dict[str, int] = {}  # folder_name -> file count
+        if FOLD_CASE:
+            filename = filename.lower()
+        if _matches(self._preserve, filename):
+            return "preserve"
+        return "exclude" if _matches(self._exclude_files, filename) else None
+
+    def _count_excluded(self, path: str) -> int:
+        """
+        Count files in an excluded directory for the skipped stats.
+        Only done with --stats: walking node_modules etc. just to count them
+        would cost more than the rest of the scan.
+        """
+        if not self.show_stats:
+            return 0
+        # Same count as os.walk's file lists, without building the lists
+        count = 0
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            count += 1
+                        elif not entry.is_symlink():
+                            stack.append(entry.path)
+            except OSError:
+                continue  # Unreadable folder (os.walk skips these too)
+        return count
+
+    def _list_dir(self, dirpath: str, rel_dir: str) -> Tuple[list, list, list, list]:
+        """
+        List a single directory (runs in a scan worker thread).
+        Returns: (subdirs as (path, rel path), excluded dirs as (name, path),
+                  files as (rel path, name, size, lstat), symlink rel paths)
+        """
+        subdirs = []
+        excluded = []
+        files = []
+        symlinks = []
+        rel_prefix = f"{rel_dir}{os.sep}" if rel_dir else ""
+
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                rel_path = rel_prefix + entry.name
 
-        try:
-            walker = os.walk(repo_path, topdown=True, onerror=self._on_walk_error)
-        except PermissionError as e:
-            print(f"  {Colors.style('Warning:', Colors.YELLOW)} Could not access {repo_path}: {e}")
-            return files_to_copy, skipped_stats
-
-        for dirpath, dirnames, filenames in walker:
-            rel_dir = os.path.relpath(dirpath, repo_path)
-            if rel_dir == ".":
-                rel_dir = ""
-
-            # Filter out excluded directories
-            dirs_to_remove = []
-            for d in dirnames:
-                if self._should_exclude_dir(d):
-                    # Count files in excluded directory
-                    excluded_path = os.path.join(dirpath, d)
-                    try:
-                        count = sum(len(files) for _, _, files in os.walk(excluded_path))
-                        skipped_stats[d] = skipped_stats.get(d, 0) + count
-                    except PermissionError:
-                        skipped_stats[d] = skipped_stats.get(d, 0)
-                    dirs_to_remove.append(d)
-            
-            for d in dirs_to_remove:
-                dirnames.remove(d)
-
-            # Process files
-            for f in filenames:
-                rel_path = os.path.join(rel_dir, f) if rel_dir else f
-                full_path = os.path.join(dirpath, f)
-                
                 # Skip symlinks (they can cause issues)
-                if os.path.islink(full_path):
-                    self.symlinks_skipped += 1
-                    if self.verbose:
-                        self._print(f"      Skipping symlink: {rel_path}")
+                if entry.is_symlink():
+                    symlinks.append(rel_path)
+                    continue
+
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    if self._should_exclude_dir(entry.name):
+                        excluded.append((entry.name, entry.path))
+                    else:
+                        subdirs.append((entry.path, rel_path))
                     continue
-                
+
+                # DirEntry caches stat data (free on Windows, one lstat elsewhere)
                 try:
-                    file_size = os.path.getsize(full_path)
+                    st = entry.stat(follow_symlinks=False)
                 except OSError:
-                    file_size = 0
-                
-                # Skip files exceeding max_size
-                if self.max_size and file_size > self.max_size:
-                    self.large_files_skipped += 1
-                    if self.verbose:
-                        size_mb = file_size / (1024 * 1024)
-                        self._print(f"      Skipping large file ({size_mb:.1f} MB): {rel_path}")
+                    files.append((rel_path, entry.name, 0, None))
                     continue
-                
-                # Check preservation first (e.g., .env files)
-                if self._should_preserve(f):
-                    files_to_copy.append((rel_path, file_size))
-                    self.preserved_files.append(f"{repo_name}/{rel_path}")
-                elif not self._should_exclude_file(f):
-                    files_to_copy.append((rel_path, file_size))
-                
-                # Track extension stats during scan (for dry run mode)
-                ext = os.path.splitext(f)[1].lower() or "(no ext)"
-                self.extension_stats[ext]["count"] += 1
-                self.extension_stats[ext]["bytes"] += file_size
+                files.append((rel_path, entry.name, st.st_size, st))
+
+        return subdirs, excluded, files, symlinks
+
+    def _walk_repo(
+        self, root: str, rel_root: str = "", cancel: Optional[threading.Event] = None
+    ) -> Tuple[List[ScannedFile], List[str], List[ExcludedDir]]:
+        """
+        Walk a directory tree, keeping up to SCAN_WORKERS directory listings in flight.
+        Paths are reported relative to the repo, with rel_root as the prefix for root.
+        Stops early (with a partial result) once cancel is set.
+        Returns: (list of (rel path, name, size, lstat) tuples, symlink rel paths,
+                  excluded folders as (name, path))
+        """
+        files: List[ScannedFile] = []
+        symlinks: List[str] = []
+        excluded_dirs: List[ExcludedDir] = []
+
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            pending = {pool.submit(self._list_dir, root, rel_root)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if cancel is not None and cancel.is_set():
+                    for future in pending:
+                        future.cancel()
+                    break
+                for future in done:
+                    try:
+                        subdirs, excluded, dir_files, dir_symlinks = future.result()
+                    except OSError as e:
+                        self._on_walk_error(e)
+                        continue
+
+                    for path, rel_dir in subdirs:
+                        pending.add(pool.submit(self._list_dir, path, rel_dir))
+                    excluded_dirs.extend(excluded)
+                    files.extend(dir_files)
+                    symlinks.extend(dir_symlinks)
+
+        # Listings complete out of order; sort so output and copy order are stable
+        files.sort()
+        symlinks.sort()
+        excluded_dirs.sort()
+        return files, symlinks, excluded_dirs
+
+    def _list_excluded_dirs(self, dirpath: str, known: Set[str]) -> List[ExcludedDir]:
+        """
+        Excluded folders below one directory git listed, as (name, path); symlinks
+        are not followed. Child folders not in known (paths git listed) hold no
+        files, so they are searched too: an empty build/ there counts as well.
+        """
+        excluded = []
+        stack = [dirpath]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if not is_dir:
+                            continue
+                        if self._should_exclude_dir(entry.name):
+                            excluded.append((entry.name, entry.path))
+                        elif entry.path not in known:
+                            stack.append(entry.path)
+            except OSError:
+                continue  # Unreadable folder (the walk reports nothing for it either)
+        return excluded
+
+    def _can_scan_git(self, repo_path: str) -> bool:
+        """Whether _scan_repo_git can list this repo (ls-files never lists .git itself)."""
+        return not self.include_git and os.path.isdir(os.path.join(repo_path, ".git"))
+
+    def _scan_repo_git(
+        self, repo_path: str, cancel: Optional[threading.Event] = None
+    ) -> Optional[Tuple[List[ScannedFile], List[str], List[ExcludedDir]]]:
+        """
+        List a repository from the git index instead of walking the filesystem.
+        Applies the same exclusions as _walk_repo and returns the same result,
+        or None if git is unavailable, fails, or cancel is set.
+        Git never lists empty folders, so each listed directory is read once more
+        for excluded folders below it (an empty dist/ still shows up in the stats).
+        """
+        if not self._can_scan_git(repo_path):
+            return None
+
+        try:
+            procs = [
+                subprocess.Popen(
+                    ["git", "ls-files", "-z"] + args,
+                    cwd=repo_path,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+                for args in (GIT_LIST_ARGS, GIT_IGNORED_ARGS)
+            ]
+        except OSError:
+            return None
+        outputs = _communicate_all(procs, cancel)
+        if outputs is None or any(proc.returncode != 0 for proc in procs):
+            return None
+
+        candidates: List[Tuple[str, str, str]] = []  # (full path, rel path, name)
+        subtrees: List[Tuple[str, str]] = []  # (full path, rel path) of listed directories
+        walked: Set[str] = set()  # git paths of subtrees
+
+        # rel dir ("/"-separated) -> first excluded path component, or None
+        excluded_in: Dict[str, Optional[str]] = {"": None}
+
+        def first_excluded(rel_dir: str) -> Optional[str]:
+            if rel_dir not in excluded_in:
+                parent, _, name = rel_dir.rpartition("/")
+                hit = first_excluded(parent)
+                if hit is None and self._should_exclude_dir(name):
+                    hit = name
+                excluded_in[rel_dir] = hit
+            return excluded_in[rel_dir]
+
+        # Plain string ops per path: git paths are already relative and "/"-separated
+        repo_prefix = repo_path + os.sep
+        native_sep = os.sep != "/"
+        paths = {os.fsdecode(p) for output in outputs for p in output.split(b"\0") if p}
+        for path in sorted(paths):
+            is_dir = path.endswith("/")
+            if is_dir:
+                path = path[:-1]
+            rel_path = path.replace("/", os.sep) if native_sep else path
+            full_path = repo_prefix + rel_path
+
+            if is_dir:
+                # Collapsed ignored directory or untracked nested repo
+                if first_excluded(path) is None:
+                    subtrees.append((full_path, rel_path))
+                    walked.add(path)
+                continue
+
+            rel_dir, _, name = path.rpartition("/")
+            if first_excluded(rel_dir) is None:
+                candidates.append((full_path, rel_path, name))
+
+        # Directories git listed something under (subtrees are walked below instead)
+        listed_dirs = {
+            rel_dir: repo_prefix + (rel_dir.replace("/", os.sep) if native_sep else rel_dir) if rel_dir else repo_path
+            for rel_dir in excluded_in
+        }
+        known = set(listed_dirs.values())
+        known.update(c[0] for c in candidates)
+        known.update(full_path for full_path, _ in subtrees)
+        search_dirs = [
+            full_path for rel_dir, full_path in listed_dirs.items()
+            if excluded_in[rel_dir] is None and rel_dir not in walked
+        ]
+
+        # Stat in concurrent batches: independent syscalls that each wait on the filesystem
+        paths = [c[0] for c in candidates]
+        batches = [paths[i:i + STAT_BATCH] for i in range(0, len(paths), STAT_BATCH)]
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            excluded_lists = pool.map(lambda path: self._list_excluded_dirs(path, known), search_dirs)
+            stats = [st for batch in pool.map(_lstat_batch, batches) for st in batch]
+            excluded_dirs: List[ExcludedDir] = [d for dirs in excluded_lists for d in dirs]
+
+        files: List[ScannedFile] = []
+        symlinks: List[str] = []
+        for (full_path, rel_path, name), st in zip(candidates, stats):
+            if st is None:
+                continue  # Tracked but deleted from the working tree
+            if stat.S_ISLNK(st.st_mode):
+                symlinks.append(rel_path)
+            elif stat.S_ISDIR(st.st_mode):
+                subtrees.append((full_path, rel_path))  # Submodule
+            else:
+                files.append((rel_path, name, st.st_size, st))
+
+        for full_path, rel_path in subtrees:
+            sub_files, sub_symlinks, sub_excluded = self._walk_repo(full_path, rel_path, cancel)
+            files.extend(sub_files)
+            symlinks.extend(sub_symlinks)
+            excluded_dirs.extend(sub_excluded)
+
+        files.sort()
+        symlinks.sort()
+        excluded_dirs.sort()
+        return files, symlinks, excluded_dirs
+
+    def _race_scans(self, repo_path: str) -> Tuple[List[ScannedFile], List[str], List[ExcludedDir]]:
+        """
+        Run the git index listing and the filesystem walk side by side and use
+        whichever finishes first: neither is fastest on every platform and drive
+        (git usually wins on local disks, walks can win on some network shares).
+        Both produce the same result; the loser is cancelled. Excluded folders
+        are left for the caller to count, so --stats walks them only once.
+        """
+        cancel = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            git_future = pool.submit(self._scan_repo_git, repo_path, cancel)
+            walk_future = pool.submit(self._walk_repo, repo_path, "", cancel)
+            done, _ = wait([git_future, walk_future], return_when=FIRST_COMPLETED)
+            result = None
+            if git_future in done and git_future.exception() is None:
+                result = git_future.result()
+            if result is None:
+                # Walk won, or git failed and the walk is still the answer
+                result = walk_future.result()
+            cancel.set()
+            return result
+        finally:
+            pool.shutdown(wait=False)
+
+    def _scan_repo(self, repo_name: str) -> Tuple[List[FileToCopy], Dict[str, int]]:
+        """
+        Scan a repository and return files to copy and skip stats.
+        Returns: (list of (relative path, size, lstat) tuples, dict of skipped folder stats)
+        """
+        repo_path = os.path.join(self.source_dir, repo_name)
+        files_to_copy: List[FileToCopy] = []
+
+        if self._can_scan_git(repo_path):
+            files, symlinks, excluded_dirs = self._race_scans(repo_path)
+        else:
+            files, symlinks, excluded_dirs = self._walk_repo(repo_path)
+
+        # Every excluded folder counts, not just each distinct name
+        self.total_dirs_skipped += len(excluded_dirs)
+        skipped_stats: Dict[str, int] = {}  # folder_name -> file count
+        for name, path in excluded_dirs:
+            skipped_stats[name] = skipped_stats.get(name, 0) + self._count_excluded(path)
+
+        self.symlinks_skipped += len(symlinks)
+        if self.verbose:
+            for rel_path in symlinks:
+                self._print(f"      Skipping symlink: {rel_path}")
 
+        # Per-file loop: bind lookups to locals, write the counter back once
+        classify_file = self._classify_file
+        ext_counts: Counter = Counter()
+        ext_bytes: Dict[str, int] = defaultdict(int)
+        keep = files_to_copy.append
+        max_size = self.max_size
+        verbose = self.verbose
+        large_files_skipped = 0
+
+        for rel_path, f, file_size, st in files:
+            # Skip files exceeding max_size
+            if max_size and file_size > max_size:
+                large_files_skipped += 1
+                if verbose:
+                    size_mb = file_size / (1024 * 1024)
+                    self._print(f"      Skipping large file ({size_mb:.1f} MB): {rel_path}")
+                continue
+
+            # Preservation wins over exclusion (e.g., .env files)
+            kind = classify_file(f)
+            if kind is None:
+                keep((rel_path, file_size, st))
+            elif kind == "preserve":
+                keep((rel_path, file_size, st))
+                self.preserved_files.append(f"{repo_name}/{rel_path}")
+
+            # Track extension stats during scan (for dry run mode)
+            ext = _file_ext(f)
+            ext_counts[ext] += 1
+            ext_bytes[ext] += file_size
+
+        self.large_files_skipped += large_files_skipped
+        # Merge into the nested stats once per extension rather than once per file
+        for ext, count in ext_counts.items():
+            ext_stat = self.extension_stats[ext]
+            ext_stat["count"] += count
+            ext_stat["bytes"] += ext_bytes[ext]
         return files_to_copy, skipped_stats
 
     def _on_walk_error(self, error: OSError) -> None:
-        """Handle errors during os.walk (e.g., permission denied)."""
+        """Handle errors while listing directories (e.g., permission denied)."""
         if self.verbose:
             self._print(f"  {Colors.style('Warning:', Colors.YELLOW)} {error}")
 
-    def _copy_repo(self, repo_name: str, files_to_copy: List[Tuple[str, int]]) -> int:
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for file copies and zip reads, shared by every repo in the run."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.jobs)
+        return self._pool
+
+    def _shutdown_pool(self) -> None:
+        """Stop the copy pool, dropping queued work (e.g. after Ctrl-C) rather than draining it."""
+        if self._pool is None:
+            return
+        if sys.version_info >= (3, 9):
+            self._pool.shutdown(cancel_futures=True)
+        else:
+            self._pool.shutdown()
+        self._pool = None
+
+    def _copy_one(self, src_file: str, dst_file: str, st: Optional[os.stat_result] = None) -> str:
+        """
+        Copy a single file (runs in a copy worker thread). st is the source's
+        lstat from the scan, if known.
+        Returns: "copied" or "overwritten"
+        """
+        if self.link_mode == "hard" and self._same_volume:
+            try:
+                return _hardlink(src_file, dst_file)
+            except OSError:
+                pass  # Filesystem without hard links (e.g. FAT); copy instead
+        if self.dedup and st is not None and st.st_size <= DEDUP_MAX_SIZE:
+            return self._copy_dedup(src_file, dst_file, st)
+        return _fastcopy(src_file, dst_file, reflink=self.link_mode == "reflink", st=st)
+
+    def _copy_dedup(self, src_file: str, dst_file: str, st: os.stat_result) -> str:
+        """
+        --dedup: hard-link dst to an earlier destination file with the same content
+        and permissions, or write it from the bytes just hashed and remember it for
+        later duplicates. Linked files share one mtime, that of the first copy.
+        Returns: "copied" or "overwritten"
+        """
+        with open(src_file, "rb") as src:
+            data = src.read()
+        key = (hashlib.blake2b(data, digest_size=16).digest(), stat.S_IMODE(st.st_mode))
+        with self._blob_lock:
+            first = self._blob_index.get(key)
+        if first is not None:
+            try:
+                status = _hardlink(first, dst_file)
+                with self._blob_lock:
+                    self.files_deduplicated += 1
+                return status
+            except OSError:
+                pass  # No hard links here, or link limit reached; copy instead
+
+        status = _write_file(dst_file, data, st)
+        with self._blob_lock:
+            self._blob_index.setdefault(key, dst_file)
+        return status
+
+    def _scan_existing(self, dst_prefix: str) -> Dict[str, int]:
+        """
+        Snapshot a destination repo folder for --skip-existing in one pass,
+        instead of a stat per file to copy.
+        Returns: {rel path: size} for every regular file under dst_prefix
+        """
+        existing = {}
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(dst_prefix + rel_dir) as it:
+                    for entry in it:
+                        rel_path = rel_dir + entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(rel_path + os.sep)
+                        elif entry.is_file(follow_symlinks=False):
+                            existing[rel_path] = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue  # Missing destination (first run) or unreadable folder
+        return existing
+
+    def _copy_repo(self, repo_name: str, files_to_copy: List[FileToCopy]) -> int:
         """Copy files from repo to destination. Returns bytes copied."""
-        src_repo = os.path.join(self.source_dir, repo_name)
-        dst_repo = os.path.join(self.dest_dir, repo_name)
+        sep = os.sep
+        src_prefix = os.path.join(self.source_dir, repo_name) + sep
+        dst_prefix = os.path.join(self.dest_dir, repo_name) + sep
         bytes_copied = 0
 
-        for rel_path, file_size in files_to_copy:
-            src_file = os.path.join(src_repo, rel_path)
-            dst_file = os.path.join(dst_repo, rel_path)
+        # Links only work within one volume; probe once instead of failing per file
+        if self.link_mode != "copy" and self._same_volume is None:
+            try:
+                self._same_volume = os.stat(self.source_dir).st_dev == os.stat(self.dest_dir).st_dev
+            except OSError:
+                self._same_volume = False
+            if not self._same_volume:
+                self._print(f"      {Colors.style('Note:', Colors.YELLOW)} --link {self.link_mode} needs source and destination on one volume; copying instead")
 
+        # Create destination directories once, not per file. Parents sort before
+        # their children, so once a parent is known to exist a single mkdir will
+        # do instead of makedirs' stat of every path component.
+        rel_dirs = {rel_path.rpartition(sep)[0] for rel_path, _, _ in files_to_copy}
+        made_dirs = self._made_dirs
+        for rel_dir in sorted(rel_dirs):
+            dst_dir = dst_prefix + rel_dir if rel_dir else dst_prefix[:-1]
+            if dst_dir in made_dirs:
+                continue
             try:
-                # Create destination directory
-                dst_dir = os.path.dirname(dst_file)
-                os.makedirs(dst_dir, exist_ok=True)
-                
-                # Check for existing file
-                if os.path.exists(dst_file):
-                    if self.skip_existing:
-                        self.files_skipped_existing += 1
-                        if self.verbose:
-                            self._print(f"      {Colors.style('Skipped (exists):', Colors.GREY)} {rel_path}")
-                        continue
-                    self.files_overwritten += 1
-                    if not self.force and not self.quiet:
-                        self._print(f"      {Colors.style('Overwriting:', Colors.YELLOW)} {rel_path}")
-
-                # Copy file
-                shutil.copy2(src_file, dst_file)
-                bytes_copied += file_size
-                
-                if self.verbose:
-                    self._print(f"      {rel_path}")
-                
+                if os.path.dirname(dst_dir) in made_dirs:
+                    try:
+                        os.mkdir(dst_dir)
+                    except FileExistsError:
+                        pass
+                else:
+                    os.makedirs(dst_dir, exist_ok=True)
+            except OSError:
+                continue  # Reported per file when the copy fails
+            for known_dir in _ancestors(dst_dir):
+                if known_dir in made_dirs:
+                    break
+                made_dirs.add(known_dir)
+
+        # A file of the same size is treated as already copied (e.g. by an interrupted run)
+        existing = self._scan_existing(dst_prefix) if self.skip_existing else {}
+
+        submit = self._get_pool().submit
+        copy_one = self._copy_one
+        max_pending = self.jobs * COPY_AHEAD_PER_JOB
+
+        # Copies are queued a bounded window ahead and collected in submission order
+        # so output stays deterministic. Counters are kept in locals and added to
+        # the run totals once.
+        verbose = self.verbose
+        warn_overwrite = not self.force and not self.quiet
+        skipped_existing = 0
+        overwritten = 0
+        failed = False
+        pending: deque = deque()
+
+        def finish_oldest() -> None:
+            nonlocal bytes_copied, skipped_existing, overwritten, failed
+            future, rel_path, file_size = pending.popleft()
+            try:
+                status = "skipped" if future is None else future.result()
             except (PermissionError, OSError) as e:
                 self._print_error(f"  Warning: Could not copy {rel_path}: {e}")
+                failed = True
+                return
+
+            if status == "skipped":
+                skipped_existing += 1
+                if verbose:
+                    self._print(f"      {Colors.style('Skipped (exists):', Colors.GREY)} {rel_path}")
+                return
+            if status == "overwritten":
+                overwritten += 1
+                if warn_overwrite:
+                    self._print(f"      {Colors.style('Overwriting:', Colors.YELLOW)} {rel_path}")
+
+            bytes_copied += file_size
 
+            if verbose:
+                self._print(f"      {rel_path}")
+
+        try:
+            for rel_path, file_size, st in files_to_copy:
+                if existing.get(rel_path) == file_size:
+                    pending.append((None, rel_path, file_size))
+                else:
+                    pending.append((submit(copy_one, src_prefix + rel_path, dst_prefix + rel_path, st), rel_path, file_size))
+                if len(pending) > max_pending:
+                    finish_oldest()
+            while pending:
+                finish_oldest()
+        finally:
+            # Interrupted (e.g. Ctrl-C): drop queued copies instead of letting the pool drain them
+            for future, _, _ in pending:
+                if future is not None:
+                    future.cancel()
+
+        self.files_skipped_existing += skipped_existing
+        self.files_overwritten += overwritten
+        if failed:
+            self.failed_repos.append(repo_name)
         return bytes_copied
 
-    def _zip_repo(self, repo_name: str, files_to_copy: List[Tuple[str, int]]) -> int:
+    def _zip_read(
+        self, src_file: str, arc_name: str, file_size: int, st: Optional[os.stat_result] = None
+    ) -> Tuple[zipfile.ZipInfo, Optional[bytes]]:
+        """
+        Prepare one archive entry (runs in a worker thread, ahead of the writer).
+        st is the source's lstat from the scan, if known.
+        Returns: (entry info, file contents, or None for large files that are streamed)
+        """
+        if st is None:
+            st = os.lstat(src_file)  # The scan's lstat failed; try once more
+        info = _zip_info(arc_name, st)
+        info.compress_type = self.compression
+        if self.compression != zipfile.ZIP_STORED and _file_ext(arc_name.rpartition("/")[2]) in INCOMPRESSIBLE_EXTS:
+            info.compress_type = zipfile.ZIP_STORED
+        if hasattr(info, "compress_level"):
+            info.compress_level = self.compress_level
+        else:
+            info._compresslevel = self.compress_level  # Python < 3.13 has no public attribute
+
+        # zf.write() loops over 8 KiB chunks in Python. Small files are read once
+        # so CRC32 and compression each run over the whole buffer in C;
+        # large files are streamed 1 MiB at a time by _zip_write.
+        if file_size > ZIP_STREAM_THRESHOLD:
+            return info, None
+        with open(src_file, "rb") as src:
+            return info, src.read()
+
+    def _zip_write(self, zf: zipfile.ZipFile, src_file: str, info: zipfile.ZipInfo, data: Optional[bytes]) -> None:
+        """Add one prepared entry to the archive (ZipFile is not thread-safe; writer thread only)."""
+        if data is not None:
+            zf.writestr(info, data)
+            return
+        with open(src_file, "rb", buffering=COPY_BUFSIZE) as src, zf.open(info, "w", force_zip64=True) as dst:
+            if _HAS_FADVISE:
+                _fadvise(src.fileno(), os.POSIX_FADV_SEQUENTIAL)
+            shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+            if _HAS_FADVISE:
+                _fadvise(src.fileno(), os.POSIX_FADV_DONTNEED)
+
+    def _zip_repo(self, repo_name: str, files_to_copy: List[FileToCopy]) -> int:
         """Create a zip archive of the repo. Returns bytes of archive."""
         src_repo = os.path.join(self.source_dir, repo_name)
         zip_path = os.path.join(self.dest_dir, f"{repo_name}.zip")
         
         try:
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for rel_path, file_size in files_to_copy:
+            # Buffer the archive itself so small entries don't each cost a write syscall
+            with open(zip_path, "wb", buffering=COPY_BUFSIZE) as out, \
+                    zipfile.ZipFile(out, "w", self.compression, compresslevel=self.compress_level) as zf:
+                zip_write = self._zip_write
+                zip_read = self._zip_read
+                submit = self._get_pool().submit
+                verbose = self.verbose
+                # Path prefixes built once per repo; files only need concatenation
+                src_prefix = src_repo + os.sep
+                # Store with repo name as root folder in zip
+                arc_prefix = repo_name.replace("\\", "/") + "/"
+
+                # Workers read ahead (bounded by count and bytes); entries are written in order here.
+                # Scan order is kept on purpose: every zip entry is deflated by its own fresh
+                # compressor, so grouping similar files would not shrink the archive, while
+                # directory order keeps reads local and archive listings predictable.
+                pending = deque()
+                pending_bytes = 0
+
+                def write_oldest() -> int:
+                    future, src_file, rel_path, read_size = pending.popleft()
+                    info, data = future.result()
+                    zip_write(zf, src_file, info, data)
+                    if verbose:
+                        self._print(f"      {rel_path}")
+                    return read_size
+
+                for rel_path, file_size, st in files_to_copy:
                     # Security: Validate rel_path to prevent path traversal
                     if ".." in rel_path or rel_path.startswith(("/", "\\")):
                         self._print_error(f"  Skipping unsafe path: {rel_path}")
                         continue
                     
-                    src_file = os.path.join(src_repo, rel_path)
-                    # Store with repo name as root folder in zip
-                    arc_name = os.path.join(repo_name, rel_path).replace("\\", "/")
-                    zf.write(src_file, arc_name)
-                    
-                    if self.verbose:
-                        self._print(f"      {rel_path}")
+                    src_file = src_prefix + rel_path
+                    arc_name = arc_prefix + rel_path.replace("\\", "/")
+                    read_size = file_size if file_size <= ZIP_STREAM_THRESHOLD else 0
+                    pending.append((submit(zip_read, src_file, arc_name, file_size, st), src_file, rel_path, read_size))
+                    pending_bytes += read_size
+                    while pending and (len(pending) > self.jobs or pending_bytes > ZIP_READAHEAD_BYTES):
+                        pending_bytes -= write_oldest()
+
+                while pending:
+                    write_oldest()
             
             return os.path.getsize(zip_path)
         except Exception as e:
             self._print_error(f"  Warning: Could not create zip for {repo_name}: {e}")
+            self.failed_repos.append(repo_name)
             return 0
 
     def run(self) -> None:
         """Execute the migration."""
         self.start_time = time.time()
+        # The destination may have changed since a previous run()
+        self._made_dirs.clear()
+        self._blob_index.clear()
         self._print()
         
         # Find repos
@@ -349,42 +1271,273 @@ class GitMigEngine:
         self._print(f"Detected {Colors.style(str(len(self.repos_found)), Colors.CYAN)} repositories in {self.source_dir}")
         self._print()
 
-        # Process each repo
-        for idx, repo_name in enumerate(self.repos_found, 1):
-            self._print(f"[{idx}/{len(self.repos_found)}] {Colors.style(repo_name + '/', Colors.BLUE)}")
-            
-            files_to_copy, skipped_stats = self._scan_repo(repo_name)
-            
-            # Calculate totals for this repo
-            total_skipped = sum(skipped_stats.values())
-            total_bytes = sum(size for _, size in files_to_copy)
-            
-            # Show what's being copied
-            mode_label = "Zipping" if self.use_zip else "Copying"
-            self._print(f"      → {mode_label}: {Colors.style(str(len(files_to_copy)), Colors.GREEN)} files")
-            
-            # Show what's being skipped
-            if skipped_stats:
-                skip_parts = [f"{k}/ ({v:,})" for k, v in sorted(skipped_stats.items(), key=lambda x: -x[1])[:5]]
-                self._print(f"      → Skipping: {Colors.style(', '.join(skip_parts), Colors.GREY)}")
-            
-            # Actually copy/zip if not dry run
-            if not self.dry_run:
-                if self.use_zip:
-                    bytes_out = self._zip_repo(repo_name, files_to_copy)
-                else:
-                    bytes_out = self._copy_repo(repo_name, files_to_copy)
-                self.total_bytes_copied += bytes_out
+        # --incremental: find repos whose HEAD and working tree match the last run
+        cache = None
+        states: Dict[str, RepoState] = {}
+        unchanged: Dict[str, dict] = {}
+        if self.incremental and not self.dry_run:
+            cache = self._load_cache()
+            states, unchanged = self._find_unchanged_repos(cache)
+        todo = [r for r in self.repos_found if r not in unchanged]
+
+        # Process each repo (in worker processes if --repo-jobs; serial keeps --verbose output ordered)
+        try:
+            if self.repo_jobs > 1 and len(todo) > 1 and not self.verbose:
+                self._run_parallel(todo, unchanged)
             else:
-                self.total_bytes_copied += total_bytes
-            
-            self.total_files_copied += len(files_to_copy)
-            self.total_files_skipped += total_skipped
-            self._print()
+                # Scan ahead in a background thread, except in --verbose where scan output must stay in order
+                scans = None if self.verbose else self._start_scanner(todo)
+                for idx, repo_name in enumerate(self.repos_found, 1):
+                    self._print_repo_header(idx, repo_name)
+                    if repo_name in unchanged:
+                        self._print_repo_unchanged(unchanged[repo_name])
+                        continue
+                    if scans is None:
+                        files_to_copy, skipped_stats = self._scan_repo(repo_name)
+                    else:
+                        result, error = scans.get()
+                        if error is not None:
+                            raise error
+                        files_to_copy, skipped_stats = result
+                    self._print_repo_plan(len(files_to_copy), skipped_stats)
+                    bytes_out = self._transfer_repo(repo_name, files_to_copy)
+                    self._tally_repo(len(files_to_copy), skipped_stats, bytes_out)
+        finally:
+            self._shutdown_pool()
+
+        if cache is not None:
+            self._save_cache(cache, states, todo)
 
         # Summary
         self._print_summary()
 
+    # -------------------------------------------------------------------------
+    # Incremental cache (--incremental)
+    # -------------------------------------------------------------------------
+
+    def _git_clean_head(self, repo_name: str) -> Optional[str]:
+        """Return the repo's HEAD commit if its working tree is clean, else None."""
+        repo_path = os.path.join(self.source_dir, repo_name)
+        try:
+            head = subprocess.run(
+                ["git", "rev-parse", "HEAD"], cwd=repo_path,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+            # Without --no-optional-locks, status refreshes and rewrites the source's .git/index
+            status = subprocess.run(
+                ["git", "--no-optional-locks", "status", "--porcelain=v2", "-z"], cwd=repo_path,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        if head.returncode != 0 or status.returncode != 0 or status.stdout:
+            return None
+        return head.stdout.decode("ascii", errors="replace").strip()
+
+    def _cache_options(self) -> list:
+        """Settings that change what gets written; a cache hit requires them to match."""
+        return [
+            self.use_zip, self.include_git, sorted(self.exclude_dirs), sorted(self.exclude_files),
+            self.max_size, self.compression, self.compress_level,
+        ]
+
+    def _load_cache(self) -> dict:
+        """Load the --incremental cache from the destination (empty if missing or invalid)."""
+        try:
+            with open(os.path.join(self.dest_dir, CACHE_FILE), encoding="utf-8") as f:
+                cache = json.load(f)
+            if isinstance(cache.get("repos"), dict):
+                return cache
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"repos": {}}
+
+    def _ignored_stats(self, repo_name: str) -> Optional[List[list]]:
+        """
+        [rel path, size, mtime] of every git-ignored file a copy would include
+        (e.g. .env or a local config), which git status doesn't report.
+        Returns None if git fails.
+        """
+        repo_path = os.path.join(self.source_dir, repo_name)
+        try:
+            listing = subprocess.run(
+                ["git", "ls-files", "-z"] + GIT_IGNORED_ARGS, cwd=repo_path,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        if listing.returncode != 0:
+            return None
+
+        result = []
+        for path in sorted(os.fsdecode(p) for p in listing.stdout.split(b"\0") if p):
+            is_dir = path.endswith("/")
+            parts = path.rstrip("/").split("/")
+            if any(self._should_exclude_dir(name) for name in (parts if is_dir else parts[:-1])):
+                continue
+            rel_path = os.path.join(*parts)
+            if is_dir:
+                # Collapsed ignored folder that gitmig copies anyway (e.g. a data/ folder)
+                files, _, _ = self._walk_repo(os.path.join(repo_path, rel_path), rel_path)
+            else:
+                st = _lstat_batch([os.path.join(repo_path, rel_path)])[0]
+                if st is None or stat.S_ISLNK(st.st_mode):
+                    continue
+                files = [(rel_path, parts[-1], st.st_size, st)]
+            for file_path, name, size, st in files:
+                if st is not None and self._classify_file(name) != "exclude":
+                    result.append([file_path, size, st.st_mtime_ns])
+        return result
+
+    def _repo_state(self, repo_name: str) -> Optional[RepoState]:
+        """(HEAD commit, ignored file stats) if the working tree is clean, else None."""
+        head = self._git_clean_head(repo_name)
+        if head is None:
+            return None
+        ignored = self._ignored_stats(repo_name)
+        return None if ignored is None else (head, ignored)
+
+    def _find_unchanged_repos(self, cache: dict) -> Tuple[Dict[str, RepoState], Dict[str, dict]]:
+        """
+        Check every repo against the cache. States are taken before copying, so
+        a file edited during the copy is seen as changed on the next run.
+        Returns: (repo -> state of clean repos, repo -> cache entry for repos to skip)
+        """
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            states = dict(zip(self.repos_found, pool.map(self._repo_state, self.repos_found)))
+        states = {repo: state for repo, state in states.items() if state}
+
+        options = self._cache_options()
+        unchanged: Dict[str, dict] = {}
+        for repo_name, (head, ignored) in states.items():
+            entry = cache["repos"].get(repo_name)
+            if not entry or entry.get("head") != head or entry.get("options") != options:
+                continue
+            # Ignored files don't show up in git status; compare them directly
+            if entry.get("ignored") != ignored:
+                continue
+            if self.use_zip:
+                output_exists = os.path.isfile(os.path.join(self.dest_dir, f"{repo_name}.zip"))
+            else:
+                output_exists = os.path.isdir(os.path.join(self.dest_dir, repo_name))
+            if output_exists:
+                entry["last_used"] = time.time()
+                unchanged[repo_name] = entry
+        return states, unchanged
+
+    def _save_cache(self, cache: dict, states: Dict[str, RepoState], processed: List[str]) -> None:
+        """Record repos processed cleanly this run, evict stale entries and write the cache."""
+        repos = cache["repos"]
+        options = self._cache_options()
+        now = time.time()
+        for repo_name in processed:
+            if repo_name not in states or repo_name in self.failed_repos:
+                repos.pop(repo_name, None)
+                continue
+            head, ignored = states[repo_name]
+            repos[repo_name] = {
+                "head": head,
+                "options": options,
+                "ignored": ignored,
+                "last_used": now,
+            }
+
+        # Drop repos that no longer exist, then the least recently used beyond the limit
+        for repo_name in list(repos):
+            if not os.path.isdir(os.path.join(self.source_dir, repo_name, ".git")):
+                del repos[repo_name]
+        if len(repos) > CACHE_MAX_REPOS:
+            for repo_name in sorted(repos, key=lambda r: repos[r].get("last_used", 0))[:len(repos) - CACHE_MAX_REPOS]:
+                del repos[repo_name]
+
+        cache_path = os.path.join(self.dest_dir, CACHE_FILE)
+        try:
+            with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError as e:
+            self._print_error(f"Warning: Could not save {CACHE_FILE}: {e}")
+
+    def _start_scanner(self, repos: List[str]) -> queue.Queue:
+        """
+        Scan repos in order in a background thread, staying at most SCAN_PREFETCH
+        repos ahead, so the next scan overlaps the current copy.
+        Returns: queue of ((files_to_copy, skipped_stats), error) per repo
+        """
+        results: queue.Queue = queue.Queue(maxsize=SCAN_PREFETCH)
+
+        def scan_all() -> None:
+            for repo_name in repos:
+                try:
+                    results.put((self._scan_repo(repo_name), None))
+                except Exception as e:
+                    results.put((None, e))
+                    return
+
+        threading.Thread(target=scan_all, name="gitmig-scanner", daemon=True).start()
+        return results
+
+    def _run_parallel(self, repos: List[str], unchanged: Dict[str, dict]) -> None:
+        """Scan and copy/zip repos in worker processes, reporting each one as it finishes."""
+        idx = 0
+        for repo_name in self.repos_found:
+            if repo_name in unchanged:
+                idx += 1
+                self._print_repo_header(idx, repo_name)
+                self._print_repo_unchanged(unchanged[repo_name])
+
+        workers = min(self.repo_jobs, len(repos))
+        with multiprocessing.Pool(workers, initializer=_init_repo_worker, initargs=(self,)) as pool:
+            # Completion order, so a slow repo doesn't hold back progress for the rest
+            for repo_name, file_count, skipped_stats, bytes_out, stats in pool.imap_unordered(_process_repo_in_worker, repos):
+                idx += 1
+                self._print_repo_header(idx, repo_name)
+                self._merge_repo_stats(stats)
+                self._print_repo_plan(file_count, skipped_stats)
+                self._tally_repo(file_count, skipped_stats, bytes_out)
+
+    def _print_repo_header(self, idx: int, repo_name: str) -> None:
+        """Print the [n/total] line for a repo."""
+        self._print(f"[{idx}/{len(self.repos_found)}] {Colors.style(repo_name + '/', Colors.BLUE)}")
+
+    def _print_repo_plan(self, file_count: int, skipped_stats: Dict[str, int]) -> None:
+        """Print what is being copied and skipped for a repo."""
+        # Show what's being copied
+        mode_label = "Zipping" if self.use_zip else "Copying"
+        self._print(f"      → {mode_label}: {Colors.style(str(file_count), Colors.GREEN)} files")
+        
+        # Show what's being skipped
+        if skipped_stats:
+            skip_parts = [f"{k}/ ({v:,})" if v else f"{k}/" for k, v in sorted(skipped_stats.items(), key=lambda x: -x[1])[:5]]
+            self._print(f"      → Skipping: {Colors.style(', '.join(skip_parts), Colors.GREY)}")
+
+    def _print_repo_unchanged(self, entry: dict) -> None:
+        """Report a repo skipped by --incremental."""
+        self.repos_unchanged += 1
+        self._print(f"      → {Colors.style('Unchanged', Colors.GREY)} since last run (commit {entry['head'][:7]}), skipping")
+        self._print()
+
+    def _transfer_repo(self, repo_name: str, files_to_copy: List[FileToCopy]) -> int:
+        """Copy or zip a scanned repo. Returns bytes written (or that would be, in dry run)."""
+        if self.dry_run:
+            return sum(size for _, size, _ in files_to_copy)
+        if self.use_zip:
+            return self._zip_repo(repo_name, files_to_copy)
+        return self._copy_repo(repo_name, files_to_copy)
+
+    def _tally_repo(self, file_count: int, skipped_stats: Dict[str, int], bytes_out: int) -> None:
+        """Add a finished repo to the run totals."""
+        self.total_bytes_copied += bytes_out
+        self.total_files_copied += file_count
+        self.total_files_skipped += sum(skipped_stats.values())
+        self._print()
+
+    def _skipped_summary(self) -> str:
+        """Describe what was skipped: file count with --stats, else folder count."""
+        if self.show_stats:
+            return f"~{Colors.style(f'{self.total_files_skipped:,}', Colors.GREY)} dependency/cache files"
+        return f"{Colors.style(f'{self.total_dirs_skipped:,}', Colors.GREY)} dependency/cache folders"
+
     def _print_summary(self) -> None:
         """Print final summary."""
         elapsed = time.time() - self.start_time
@@ -394,12 +1547,12 @@ class GitMigEngine:
         if self.dry_run:
             self._print(Colors.style("DRY RUN COMPLETE", Colors.YELLOW) + " (no files copied)")
             self._print(f"Would copy: {Colors.style(f'{self.total_files_copied:,}', Colors.GREEN)} files across {len(self.repos_found)} repos")
-            self._print(f"Would skip: ~{Colors.style(f'{self.total_files_skipped:,}', Colors.GREY)} dependency/cache files")
+            self._print(f"Would skip: {self._skipped_summary()}")
         else:
             mode = "ZIPPED" if self.use_zip else "COPIED"
             self._print(Colors.style(f"MIGRATION COMPLETE ({mode})", Colors.GREEN))
             self._print(f"Copied: {Colors.style(f'{self.total_files_copied:,}', Colors.GREEN)} files across {len(self.repos_found)} repos")
-            self._print(f"Skipped: ~{Colors.style(f'{self.total_files_skipped:,}', Colors.GREY)} dependency/cache files")
+            self._print(f"Skipped: {self._skipped_summary()}")
             
             # Show size
             if self.total_bytes_copied > 0:
@@ -429,9 +1582,17 @@ class GitMigEngine:
         if self.files_overwritten > 0:
             self._print(f"Files overwritten: {Colors.style(str(self.files_overwritten), Colors.YELLOW)}")
         
+        # Show repos skipped (--incremental)
+        if self.repos_unchanged > 0:
+            self._print(f"Repos unchanged (skipped): {Colors.style(str(self.repos_unchanged), Colors.GREY)}")
+        
         # Show files skipped (--skip-existing)
         if self.files_skipped_existing > 0:
             self._print(f"Files skipped (existing): {Colors.style(str(self.files_skipped_existing), Colors.GREY)}")
+
+        # Show duplicates linked (--dedup)
+        if self.files_deduplicated > 0:
+            self._print(f"Duplicate files linked: {Colors.style(str(self.files_deduplicated), Colors.GREY)}")
         # Show execution time
         self._print(f"\nCompleted in {Colors.style(f'{elapsed:.2f}s', Colors.CYAN)}")
         
@@ -472,6 +1633,33 @@ class GitMigEngine:
             self._print(f"{ext:<15} {stats['count']:>10,} {size_str:>12}")
 
 
+# =============================================================================
+# Parallel Repos (--repo-jobs)
+# =============================================================================
+
+# Engine copy owned by each worker process
+_worker_engine: Optional[GitMigEngine] = None
+
+
+def _init_repo_worker(engine: GitMigEngine) -> None:
+    """Worker process initializer: keep a quiet copy of the engine."""
+    global _worker_engine
+    _worker_engine = engine
+    _worker_engine.quiet = True  # The parent reports progress; errors still print
+
+
+def _process_repo_in_worker(repo_name: str) -> Tuple[str, int, Dict[str, int], int, dict]:
+    """
+    Scan and copy/zip one repo in a worker process.
+    Returns: (repo name, files copied, skipped folder stats, bytes written, stats to merge)
+    """
+    engine = _worker_engine
+    engine._reset_stats()
+    files_to_copy, skipped_stats = engine._scan_repo(repo_name)
+    bytes_out = engine._transfer_repo(repo_name, files_to_copy)
+    return repo_name, len(files_to_copy), skipped_stats, bytes_out, engine._repo_stats()
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -547,7 +1735,50 @@ def main():
     parser.add_argument(
         "--skip-existing",
         action="store_true",
-        help="Skip files that already exist at destination (resume mode)"
+        help="Skip files that already exist at destination with the same size (resume mode)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help=f"Number of files to copy concurrently (default: {DEFAULT_COPY_JOBS})"
+    )
+    parser.add_argument(
+        "--compress-method",
+        choices=list(COMPRESS_METHODS),
+        default="deflate",
+        help="Zip compression method (default: deflate; zstd needs Python 3.14+)"
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        default=DEFAULT_COMPRESS_LEVEL,
+        help=f"Zip compression level (default: {DEFAULT_COMPRESS_LEVEL}, fastest)"
+    )
+    parser.add_argument(
+        "--repo-jobs",
+        type=int,
+        default=1,
+        help="Process this many repos in parallel worker processes (ignored with --verbose)"
+    )
+    parser.add_argument(
+        "--link",
+        choices=LINK_MODES,
+        default="copy",
+        help="How to place files: copy (default), hard links (zero-copy, but edits to "
+             "either side show up in both), or reflink clones on CoW filesystems"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Skip repos whose commit and working tree are unchanged since the last run (state in {CACHE_FILE})"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Hard-link files with identical content (up to 1 MB, e.g. LICENSE or lockfiles) "
+             "instead of copying them again; edits to one copy show up in all, and linked "
+             "copies keep the first copy's modification time"
     )
 
     args = parser.parse_args()
@@ -586,6 +1817,21 @@ def main():
             print(f"Error: Invalid size format '{args.max_size}'. Use format like '10M', '500K', or '1G'.")
             sys.exit(1)
 
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1.")
+        sys.exit(1)
+
+    if args.repo_jobs < 1:
+        print("Error: --repo-jobs must be at least 1.")
+        sys.exit(1)
+
+    if COMPRESS_METHODS[args.compress_method] is None:
+        print(f"Error: --compress-method {args.compress_method} is not supported by this Python version.")
+        sys.exit(1)
+    if args.compress_method == "deflate" and not 0 <= args.compress_level <= 9:
+        print("Error: --compress-level for deflate must be between 0 and 9.")
+        sys.exit(1)
+
     # Validate source
     if not os.path.isdir(source_dir):
         print(f"Error: Source '{source_dir}' is not a valid directory.")
@@ -627,6 +1873,13 @@ def main():
         force=args.force,
         stats_all=args.stats_all,
         skip_existing=args.skip_existing,
+        jobs=args.jobs,
+        compress_method=args.compress_method,
+        compress_level=args.compress_level,
+        repo_jobs=args.repo_jobs,
+        link_mode=args.link,
+        incremental=args.incremental,
+        dedup=args.dedup,
     )
     
     try:
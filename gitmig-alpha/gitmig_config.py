@@ -4,6 +4,12 @@ Configuration file for gitmig.
 Contains excluded directories, patterns, and preserved files.
 """
 
+import fnmatch
+import os
+import re
+import sys
+from typing import FrozenSet, List, Optional, Pattern, Tuple
+
 # =============================================================================
 # 1. Directories to Always Exclude
 # =============================================================================
@@ -76,8 +82,52 @@ PRESERVE_PATTERNS = [
 ]
 
 # =============================================================================
-# 4. ANSI Colors
+# 4. Compiled Patterns (built once at import; used by the scan hot path)
+# =============================================================================
+# fnmatch folds case on Windows (os.path.normcase); names never contain separators,
+# so lower() is equivalent and skips the normcase call on other platforms.
+FOLD_CASE = os.path.normcase("A") == "a"
+
+
+def compile_patterns(patterns: List[str]) -> Tuple[FrozenSet[str], Optional[Tuple[str, ...]], Optional[Pattern]]:
+    """
+    Compile fnmatch patterns once for repeated matching.
+    Returns: (set of literal names,
+              literal suffixes every wildcard match must end with, or None if unknown,
+              one regex for all wildcard patterns or None)
+    All are case-folded like fnmatch.fnmatch when FOLD_CASE is set.
+    """
+    if FOLD_CASE:
+        patterns = [p.lower() for p in patterns]
+    literals = frozenset(p for p in patterns if not any(c in p for c in "*?["))
+    globs = [p for p in patterns if p not in literals]
+    if not globs:
+        return literals, None, None
+
+    # "*.egg-info" can only match names ending in ".egg-info"; str.endswith rules
+    # out most names before the regex runs. Patterns ending in a wildcard disable this.
+    suffixes = tuple(re.split(r"[*?\[\]]", p)[-1] for p in globs)
+    regex = re.compile("|".join(fnmatch.translate(p) for p in globs))
+    return literals, suffixes if all(suffixes) else None, regex
+
+
+EXCLUDE_DIRS_LITERAL, EXCLUDE_DIRS_GLOB_SUFFIXES, EXCLUDE_DIRS_GLOB_RE = compile_patterns(EXCLUDE_DIRS)
+EXCLUDE_FILE_LITERAL, EXCLUDE_FILE_SUFFIXES, EXCLUDE_FILE_RE = compile_patterns(EXCLUDE_FILE_PATTERNS)
+PRESERVE_LITERAL, PRESERVE_SUFFIXES, PRESERVE_RE = compile_patterns(PRESERVE_PATTERNS)
+
+# =============================================================================
+# 5. ANSI Colors
 # =============================================================================
+def _styled(text: str, color: str, enabled: bool = True) -> str:
+    if not enabled:
+        return text
+    return f"{color}{text}\033[0m"
+
+
+def _plain(text: str, color: str, enabled: bool = True) -> str:
+    return text
+
+
 class Colors:
     RESET = "\033[0m"
     
@@ -89,8 +139,8 @@ class Colors:
     CYAN = "\033[96m"
     WHITE = "\033[97m"
 
-    @staticmethod
-    def style(text: str, color: str, enabled: bool = True) -> str:
-        if not enabled:
-            return text
-        return f"{color}{text}{Colors.RESET}"
+    # Decided once: no escape codes when output is piped or redirected, or
+    # when NO_COLOR is set (https://no-color.org)
+    ENABLED = sys.stdout is not None and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+    style = staticmethod(_styled if ENABLED else _plain)
@@ -9,7 +9,7 @@ setup(
             "gitmig=gitmig:main",
         ],
     },
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     author="qtremors",
     description="A lightweight tool to copy git repositories without dependencies.",
 )
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+test_extract_docs.py
+
+Unit tests for extract_docs.
+Run with: python -m pytest test_extract_docs.py -v
+Or: python test_extract_docs.py
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import extract_docs
+
+
+class TestGitListing(unittest.TestCase):
+    """Test reading markdown paths from a 'git ls-files -z' process."""
+
+    def _fake_proc(self, output: bytes):
+        """Helper to create a finished git process with the given stdout."""
+        proc = Mock()
+        proc.stdout = io.BytesIO(output)
+        return proc
+
+    def test_path_split_across_chunks(self):
+        """Test that a path split between two reads is rejoined."""
+        proc = self._fake_proc(b"docs/README.md\0src/main.py\0docs/guide.md")
+        with patch("extract_docs.GIT_READ_CHUNK", 5):
+            paths = list(extract_docs.iter_git_tracked_files(proc))
+
+        self.assertEqual(paths, ["docs/README.md", "docs/guide.md"])
+        proc.wait.assert_called_once()
+
+    def test_uppercase_extension_matches(self):
+        """Test that .MD and .Md files are picked up and other files are not."""
+        proc = self._fake_proc(b"CHANGELOG.MD\0notes.Md\0setup.py\0md\0")
+        paths = list(extract_docs.iter_git_tracked_files(proc))
+
+        self.assertEqual(paths, ["CHANGELOG.MD", "notes.Md"])
+
+
+class TestExtractMarkdownFiles(unittest.TestCase):
+    """Test extract_markdown_files end to end."""
+
+    def setUp(self):
+        """Create temporary directories for testing."""
+        self.test_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.test_dir, "source")
+        self.dest_dir = os.path.join(self.test_dir, "dest")
+        repo_path = os.path.join(self.source_dir, "repo")
+        os.makedirs(os.path.join(repo_path, ".git"))
+        os.makedirs(os.path.join(repo_path, "docs"))
+        for rel_path in ("README.md", os.path.join("docs", "guide.md"), "main.py"):
+            with open(os.path.join(repo_path, rel_path), "w") as f:
+                f.write("text")
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _extract(self) -> str:
+        """Helper to run the extraction and return what it printed."""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            extract_docs.extract_markdown_files(self.source_dir, self.dest_dir)
+        return out.getvalue()
+
+    def test_git_failure_falls_back_without_double_counting(self):
+        """Test that files streamed before git fails are counted once, by the fallback walk."""
+        def failing_git(repo_path):
+            # Lists one file, then exits nonzero
+            return subprocess.Popen(
+                [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'README.md\\0'); sys.exit(1)"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            )
+
+        with patch("extract_docs.start_git_ls_files", side_effect=failing_git):
+            output = self._extract()
+
+        self.assertIn("Scanning Directory (Non-Git): repo", output)
+        self.assertIn("Total MD files copied: 2", output)
+        self.assertTrue(os.path.isfile(os.path.join(self.dest_dir, "repo", "docs", "guide.md")))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
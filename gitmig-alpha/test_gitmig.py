@@ -9,13 +9,20 @@ Or: python test_gitmig.py
 
 import os
 import shutil
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 import unittest
 import zipfile
 from unittest.mock import patch
 
 from gitmig import GitMigEngine
-from gitmig_config import EXCLUDE_DIRS, EXCLUDE_FILE_PATTERNS, PRESERVE_PATTERNS
+from gitmig_config import (
+    EXCLUDE_DIRS, EXCLUDE_FILE_PATTERNS, PRESERVE_PATTERNS,
+    EXCLUDE_DIRS_LITERAL, EXCLUDE_DIRS_GLOB_RE, EXCLUDE_FILE_RE, PRESERVE_RE, compile_patterns,
+)
 
 
 class TestGitMigEngine(unittest.TestCase):
@@ -76,75 +83,6 @@ class TestGitMigEngine(unittest.TestCase):
         repos = engine._find_repos()
         self.assertEqual(repos, [])
 
-    # =========================================================================
-    # Exclusion Tests
-    # =========================================================================
-
-    def test_should_exclude_dir_node_modules(self):
-        """Test that node_modules is excluded."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertTrue(engine._should_exclude_dir("node_modules"))
-
-    def test_should_exclude_dir_git(self):
-        """Test that .git is excluded by default."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertTrue(engine._should_exclude_dir(".git"))
-
-    def test_should_exclude_dir_with_include_git(self):
-        """Test that .git is NOT excluded when --include-git is set."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir, include_git=True)
-        self.assertFalse(engine._should_exclude_dir(".git"))
-
-    def test_should_exclude_dir_venv(self):
-        """Test that venv directories are excluded."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertTrue(engine._should_exclude_dir("venv"))
-        self.assertTrue(engine._should_exclude_dir(".venv"))
-
-    def test_should_exclude_file_log(self):
-        """Test that .log files are excluded."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertTrue(engine._should_exclude_file("debug.log"))
-        self.assertTrue(engine._should_exclude_file("app.log"))
-
-    def test_should_exclude_file_pyc(self):
-        """Test that .pyc files are excluded."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertTrue(engine._should_exclude_file("module.pyc"))
-
-    def test_should_not_exclude_source_files(self):
-        """Test that source files are NOT excluded."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertFalse(engine._should_exclude_file("main.py"))
-        self.assertFalse(engine._should_exclude_file("index.js"))
-        self.assertFalse(engine._should_exclude_file("README.md"))
-
-    def test_extra_excludes(self):
-        """Test custom exclusion patterns."""
-        engine = GitMigEngine(
-            self.source_dir, self.dest_dir, 
-            extra_excludes=["*.txt", "temp/"]
-        )
-        self.assertTrue(engine._should_exclude_file("notes.txt"))
-        self.assertTrue(engine._should_exclude_dir("temp"))
-
-    # =========================================================================
-    # Preservation Tests
-    # =========================================================================
-
-    def test_should_preserve_env_file(self):
-        """Test that .env files are preserved."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertTrue(engine._should_preserve(".env"))
-        self.assertTrue(engine._should_preserve(".env.local"))
-        self.assertTrue(engine._should_preserve(".env.production"))
-
-    def test_should_not_preserve_regular_files(self):
-        """Test that regular files are not marked for preservation."""
-        engine = GitMigEngine(self.source_dir, self.dest_dir)
-        self.assertFalse(engine._should_preserve("main.py"))
-        self.assertFalse(engine._should_preserve("package.json"))
-
     # =========================================================================
     # Scan Tests
     # =========================================================================
@@ -187,6 +125,67 @@ class TestGitMigEngine(unittest.TestCase):
         # But should track skipped count
         self.assertIn("node_modules", skipped)
 
+    @unittest.skipUnless(hasattr(os, "symlink"), "needs symlink support")
+    def test_walk_never_enters_excluded_or_linked_dirs(self):
+        """Test that the walker lists neither excluded folders nor symlinked folders."""
+        repo_path = self._create_repo("test_repo", {
+            "src/app.py": "# app",
+            "node_modules/pkg/index.js": "// dep",
+        })
+        try:
+            os.symlink(repo_path, os.path.join(repo_path, "src", "loop"))
+        except OSError:
+            self.skipTest("symlinks not permitted")
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        with patch.object(engine, "_list_dir", wraps=engine._list_dir) as list_dir:
+            files, symlinks, _ = engine._walk_repo(repo_path)
+
+        listed = {os.path.relpath(args[0], repo_path) for args, _ in list_dir.call_args_list}
+        self.assertEqual(listed, {".", "src"})
+        self.assertEqual([f[0] for f in files], [os.path.join("src", "app.py")])
+        self.assertEqual(symlinks, [os.path.join("src", "loop")])
+
+    def test_skipped_files_counted_only_with_stats(self):
+        """Test that excluded folders are only walked for counts with --stats."""
+        repo_path = self._create_repo("test_repo", {"index.js": "// app"})
+        nm_path = os.path.join(repo_path, "node_modules", "pkg")
+        os.makedirs(nm_path)
+        for name in ("a.js", "b.js"):
+            with open(os.path.join(nm_path, name), "w") as f:
+                f.write("// dep")
+
+        _, skipped = GitMigEngine(self.source_dir, self.dest_dir)._scan_repo("test_repo")
+        self.assertEqual(skipped["node_modules"], 0)
+
+        _, skipped = GitMigEngine(self.source_dir, self.dest_dir, show_stats=True)._scan_repo("test_repo")
+        self.assertEqual(skipped["node_modules"], 2)
+
+    def test_stats_count_excluded_folders_once(self):
+        """Test that --stats counts each excluded folder once, not once per scan in the race."""
+        repo_path = self._create_repo("test_repo", {"index.js": "// app", "node_modules/a.js": "// dep"})
+        subprocess.run(["git", "init", "-q"], cwd=repo_path, check=True)
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, show_stats=True)
+        with patch.object(engine, "_count_excluded", wraps=engine._count_excluded) as count_excluded:
+            _, skipped = engine._scan_repo("test_repo")
+
+        counted = sorted(os.path.basename(args[0]) for args, _ in count_excluded.call_args_list)
+        self.assertEqual(counted, [".git", "node_modules"])
+        self.assertEqual(skipped["node_modules"], 1)
+
+    def test_skipped_folders_counted_per_folder(self):
+        """Test that the summary counts every excluded folder, not each distinct name once."""
+        self._create_repo("test_repo", {
+            "web/node_modules/a.js": "// dep",
+            "api/node_modules/b.js": "// dep",
+        })
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, quiet=True)
+        engine.run()
+
+        self.assertEqual(engine.total_dirs_skipped, 3)  # .git and both node_modules
+
     def test_scan_repo_preserves_env(self):
         """Test that .env files are included even though they match exclusion patterns."""
         self._create_repo("test_repo", {
@@ -219,6 +218,69 @@ class TestGitMigEngine(unittest.TestCase):
         self.assertEqual(engine.extension_stats[".py"]["count"], 2)
         self.assertEqual(engine.extension_stats[".js"]["count"], 1)
 
+    @unittest.skipUnless(shutil.which("git"), "git not installed")
+    def test_git_scan_matches_walk(self):
+        """Test that the git ls-files fast path finds the same files as a walk."""
+        repo_path = os.path.join(self.source_dir, "test_repo")
+        os.makedirs(repo_path)
+        subprocess.run(["git", "init", "-q"], cwd=repo_path, check=True)
+        for filepath, content in {
+            "main.py": "print(1)",
+            "src/utils.py": "# utils",
+            ".gitignore": "node_modules/\n.env\n",
+            ".env": "SECRET=1",
+            "notes.txt": "untracked",
+            "node_modules/pkg/index.js": "// dep",
+        }.items():
+            full_path = os.path.join(repo_path, filepath)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write(content)
+        # Empty excluded folders git never lists, including under folders with no files
+        for empty_dir in ("dist", "web/dist", "empty_parent/build"):
+            os.makedirs(os.path.join(repo_path, empty_dir))
+        subprocess.run(["git", "add", "main.py", "src/utils.py", ".gitignore"], cwd=repo_path, check=True)
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        git_result = engine._scan_repo_git(repo_path)
+
+        self.assertIsNotNone(git_result)
+        self.assertEqual(git_result, engine._walk_repo(repo_path))
+        self.assertIn(".env", [f[0] for f in git_result[0]])
+        self.assertEqual([name for name, _ in git_result[2]], [".git", "build", "dist", "dist", "node_modules"])
+
+    def test_git_scan_kills_git_when_cancelled(self):
+        """Test that a git listing that lost the scan race is killed rather than left running."""
+        repo_path = self._create_repo("test_repo", {"main.py": "print(1)"})
+        procs = []
+        popen = subprocess.Popen
+
+        def slow_git(*args, **kwargs):
+            proc = popen([sys.executable, "-c", "import time; time.sleep(30)"], **kwargs)
+            procs.append(proc)
+            return proc
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+        start = time.time()
+        with patch("gitmig.subprocess.Popen", side_effect=slow_git):
+            self.assertIsNone(engine._scan_repo_git(repo_path, cancel))
+
+        self.assertLess(time.time() - start, 10)
+        self.assertEqual(len(procs), 2)
+        self.assertTrue(all(proc.returncode is not None for proc in procs))
+
+    def test_scan_falls_back_to_walk_when_git_fails(self):
+        """Test that the scan race uses the walk result when git listing fails."""
+        self._create_repo("test_repo", {"main.py": "print(1)"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        with patch.object(engine, "_scan_repo_git", return_value=None):
+            files, _ = engine._scan_repo("test_repo")
+
+        self.assertEqual([f[0] for f in files], ["main.py"])
+
     # =========================================================================
     # Copy Tests
     # =========================================================================
@@ -263,6 +325,111 @@ class TestGitMigEngine(unittest.TestCase):
         self.assertTrue(os.path.exists(os.path.join(base, "src", "components", "Input.js")))
         self.assertTrue(os.path.exists(os.path.join(base, "src", "utils", "helpers.js")))
 
+    def test_copy_preserves_mtime(self):
+        """Test that copied files keep the source modification time."""
+        repo_path = self._create_repo("test_repo", {"main.py": "print(1)"})
+        src = os.path.join(repo_path, "main.py")
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        files, _ = engine._scan_repo("test_repo")
+        engine._copy_repo("test_repo", files)
+
+        dst = os.path.join(self.dest_dir, "test_repo", "main.py")
+        self.assertEqual(int(os.path.getmtime(dst)), 1_000_000_000)
+
+    def test_copy_falls_back_when_kernel_copy_returns_zero(self):
+        """Test that an immediate 0 from copy_file_range/sendfile on a non-empty file is not taken as EOF."""
+        self._create_repo("test_repo", {"main.py": "print(1)"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        files, _ = engine._scan_repo("test_repo")
+        with patch("os.copy_file_range", return_value=0, create=True), \
+                patch("os.sendfile", return_value=0, create=True):
+            engine._copy_repo("test_repo", files)
+
+        with open(os.path.join(self.dest_dir, "test_repo", "main.py")) as f:
+            self.assertEqual(f.read(), "print(1)")
+
+    def test_interrupt_drops_queued_copies(self):
+        """Test that Ctrl-C during a copy doesn't leave every remaining file queued to be copied."""
+        self._create_repo("test_repo", {f"f{i}.txt": str(i) for i in range(500)})
+        engine = GitMigEngine(self.source_dir, self.dest_dir, jobs=2, quiet=True)
+        copy_one = engine._copy_one
+        calls = []
+
+        def interrupted_copy(*args):
+            calls.append(args[0])
+            if len(calls) == 10:
+                raise KeyboardInterrupt
+            return copy_one(*args)
+
+        with patch.object(engine, "_copy_one", side_effect=interrupted_copy):
+            with self.assertRaises(KeyboardInterrupt):
+                engine.run()
+
+        self.assertIsNone(engine._pool)
+        self.assertLess(len(calls), 50)
+
+    def test_copy_hard_links(self):
+        """Test that --link hard links files instead of copying them."""
+        repo_path = self._create_repo("test_repo", {"main.py": "print(1)"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, link_mode="hard")
+        files, _ = engine._scan_repo("test_repo")
+        engine._copy_repo("test_repo", files)
+
+        src = os.path.join(repo_path, "main.py")
+        dst = os.path.join(self.dest_dir, "test_repo", "main.py")
+        self.assertTrue(os.path.samefile(src, dst))
+
+    def test_copy_over_hard_link_keeps_source(self):
+        """Test that a plain copy over a hard-linked destination does not write through to the source."""
+        repo_path = self._create_repo("test_repo", {"main.py": "print(1)"})
+        src = os.path.join(repo_path, "main.py")
+        dst = os.path.join(self.dest_dir, "test_repo", "main.py")
+        GitMigEngine(self.source_dir, self.dest_dir, link_mode="hard", quiet=True).run()
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, force=True)
+        files, _ = engine._scan_repo("test_repo")
+        engine._copy_repo("test_repo", files)
+
+        self.assertFalse(os.path.samefile(src, dst))
+        with open(src) as f:
+            self.assertEqual(f.read(), "print(1)")
+
+    def test_dedup_links_identical_files(self):
+        """Test that --dedup hard-links identical files across repos."""
+        self._create_repo("repo_a", {"LICENSE": "MIT License", "a.py": "a"})
+        self._create_repo("repo_b", {"LICENSE": "MIT License", "b.py": "b"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, dedup=True, quiet=True)
+        with patch("gitmig._fastcopy") as fastcopy:
+            engine.run()
+
+        fastcopy.assert_not_called()  # Misses are written from the bytes already hashed
+        with open(os.path.join(self.dest_dir, "repo_b", "b.py")) as f:
+            self.assertEqual(f.read(), "b")
+        self.assertTrue(os.path.samefile(
+            os.path.join(self.dest_dir, "repo_a", "LICENSE"),
+            os.path.join(self.dest_dir, "repo_b", "LICENSE"),
+        ))
+        self.assertEqual(engine.files_deduplicated, 1)
+
+    def test_copy_repo_parallel_jobs(self):
+        """Test that concurrent copies copy every file with correct content."""
+        files = {f"pkg{i % 5}/mod{i}.py": f"# module {i}" for i in range(40)}
+        self._create_repo("test_repo", files)
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, jobs=8)
+        scanned, _ = engine._scan_repo("test_repo")
+        bytes_copied = engine._copy_repo("test_repo", scanned)
+
+        self.assertEqual(bytes_copied, sum(len(c) for c in files.values()))
+        for rel_path, content in files.items():
+            with open(os.path.join(self.dest_dir, "test_repo", rel_path)) as f:
+                self.assertEqual(f.read(), content)
+
     # =========================================================================
     # Zip Tests
     # =========================================================================
@@ -309,6 +476,88 @@ class TestGitMigEngine(unittest.TestCase):
             names = zf.namelist()
             self.assertFalse(any("node_modules" in n for n in names))
 
+    def test_zip_streams_large_files(self):
+        """Test that large files are streamed into the archive intact."""
+        content = "x" * 5000
+        self._create_repo("test_repo", {"big.txt": content, "small.txt": "s"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, use_zip=True, compress_level=9)
+        files, _ = engine._scan_repo("test_repo")
+        with patch("gitmig.ZIP_STREAM_THRESHOLD", 1000):
+            engine._zip_repo("test_repo", files)
+
+        with zipfile.ZipFile(os.path.join(self.dest_dir, "test_repo.zip"), "r") as zf:
+            self.assertEqual(zf.read("test_repo/big.txt").decode(), content)
+            self.assertEqual(zf.getinfo("test_repo/big.txt").compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zf.read("test_repo/small.txt").decode(), "s")
+
+    def test_zip_store_method(self):
+        """Test that --compress-method store writes uncompressed entries."""
+        self._create_repo("test_repo", {"main.py": "print('hello')"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, use_zip=True, compress_method="store")
+        files, _ = engine._scan_repo("test_repo")
+        engine._zip_repo("test_repo", files)
+
+        with zipfile.ZipFile(os.path.join(self.dest_dir, "test_repo.zip"), "r") as zf:
+            self.assertEqual(zf.getinfo("test_repo/main.py").compress_type, zipfile.ZIP_STORED)
+
+    def test_zip_stores_incompressible_files(self):
+        """Test that already-compressed formats are stored rather than deflated."""
+        self._create_repo("test_repo", {"main.py": "print('hello')", "assets/logo.png": "png data"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, use_zip=True)
+        files, _ = engine._scan_repo("test_repo")
+        engine._zip_repo("test_repo", files)
+
+        with zipfile.ZipFile(os.path.join(self.dest_dir, "test_repo.zip"), "r") as zf:
+            self.assertEqual(zf.getinfo("test_repo/main.py").compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zf.getinfo("test_repo/assets/logo.png").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zf.read("test_repo/assets/logo.png"), b"png data")
+
+    def test_zip_keeps_mtime_and_clamps_old_dates(self):
+        """Test that zip entries take their timestamp from the scan, clamping pre-1980 dates."""
+        repo_path = self._create_repo("test_repo", {"new.py": "new", "old.py": "old"})
+        mtime = time.mktime((2021, 6, 1, 12, 0, 0, 0, 0, -1))
+        os.utime(os.path.join(repo_path, "new.py"), (mtime, mtime))
+        os.utime(os.path.join(repo_path, "old.py"), (0, 0))
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, use_zip=True)
+        files, _ = engine._scan_repo("test_repo")
+        engine._zip_repo("test_repo", files)
+
+        self.assertEqual(engine.failed_repos, [])
+        with zipfile.ZipFile(os.path.join(self.dest_dir, "test_repo.zip"), "r") as zf:
+            self.assertEqual(zf.getinfo("test_repo/new.py").date_time, (2021, 6, 1, 12, 0, 0))
+            self.assertEqual(zf.getinfo("test_repo/old.py").date_time, (1980, 1, 1, 0, 0, 0))
+
+    def test_zip_entry_without_scan_stat(self):
+        """Test that a file the scan couldn't stat still gets a zip entry with its timestamp."""
+        repo_path = self._create_repo("test_repo", {"main.py": "print(1)"})
+        src = os.path.join(repo_path, "main.py")
+        os.utime(src, (0, 0))
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, use_zip=True)
+        engine._zip_repo("test_repo", [("main.py", 8, None)])
+
+        self.assertEqual(engine.failed_repos, [])
+        with zipfile.ZipFile(os.path.join(self.dest_dir, "test_repo.zip"), "r") as zf:
+            self.assertEqual(zf.getinfo("test_repo/main.py").date_time, (1980, 1, 1, 0, 0, 0))
+            self.assertEqual(zf.read("test_repo/main.py"), b"print(1)")
+
+    def test_zip_readahead_keeps_order(self):
+        """Test that zip entries read ahead by workers are written in scan order."""
+        files = {f"mod{i:02d}.py": f"# module {i}" * i for i in range(30)}
+        self._create_repo("test_repo", files)
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, use_zip=True, jobs=4)
+        scanned, _ = engine._scan_repo("test_repo")
+        engine._zip_repo("test_repo", scanned)
+
+        with zipfile.ZipFile(os.path.join(self.dest_dir, "test_repo.zip"), "r") as zf:
+            self.assertEqual(zf.namelist(), [f"test_repo/{f[0]}" for f in scanned])
+            self.assertEqual(zf.read("test_repo/mod07.py").decode(), files["mod07.py"])
+
     # =========================================================================
     # ZIP Path Traversal Security Test
     # =========================================================================
@@ -406,10 +655,35 @@ class TestGitMigEngine(unittest.TestCase):
         # Folder should NOT exist
         self.assertFalse(os.path.isdir(os.path.join(self.dest_dir, "repo1")))
 
+    def test_full_run_parallel_repos(self):
+        """Test that --repo-jobs copies all repos and merges worker stats."""
+        self._create_repo("repo1", {"main.py": "print(1)", ".env": "A=1"})
+        self._create_repo("repo2", {"app.js": "console.log(2)"})
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, quiet=True, repo_jobs=2)
+        engine.run()
+
+        self.assertTrue(os.path.exists(os.path.join(self.dest_dir, "repo1", "main.py")))
+        self.assertTrue(os.path.exists(os.path.join(self.dest_dir, "repo2", "app.js")))
+        self.assertEqual(engine.total_files_copied, 3)
+        self.assertEqual(engine.extension_stats[".py"]["count"], 1)
+        self.assertEqual(engine.preserved_files, ["repo1/.env"])
+
     # =========================================================================
     # New Feature Tests
     # =========================================================================
 
+    def test_run_twice_after_destination_removed(self):
+        """Test that a second run() recreates folders removed since the first."""
+        self._create_repo("test_repo", {"src/main.py": "print(1)"})
+        engine = GitMigEngine(self.source_dir, self.dest_dir, quiet=True)
+        engine.run()
+
+        shutil.rmtree(os.path.join(self.dest_dir, "test_repo"))
+        engine.run()
+
+        self.assertTrue(os.path.exists(os.path.join(self.dest_dir, "test_repo", "src", "main.py")))
+
     def test_max_size_skips_large_files(self):
         """Test that --max-size skips files exceeding the limit."""
         self._create_repo("test_repo", {
@@ -426,6 +700,56 @@ class TestGitMigEngine(unittest.TestCase):
         self.assertNotIn("large.txt", file_paths)
         self.assertEqual(engine.large_files_skipped, 1)
 
+    @unittest.skipUnless(shutil.which("git"), "git not installed")
+    def test_incremental_skips_unchanged_repos(self):
+        """Test that --incremental skips a clean repo whose HEAD hasn't moved."""
+        repo_path = os.path.join(self.source_dir, "repo1")
+        os.makedirs(repo_path)
+        with open(os.path.join(repo_path, "main.py"), "w") as f:
+            f.write("print(1)")
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q"], cwd=repo_path, check=True)
+        subprocess.run(git + ["add", "."], cwd=repo_path, check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=repo_path, check=True)
+
+        first = GitMigEngine(self.source_dir, self.dest_dir, quiet=True, incremental=True)
+        first.run()
+        self.assertEqual(first.total_files_copied, 1)
+
+        second = GitMigEngine(self.source_dir, self.dest_dir, quiet=True, incremental=True)
+        second.run()
+        self.assertEqual(second.repos_unchanged, 1)
+        self.assertEqual(second.total_files_copied, 0)
+
+        # A dirty working tree is copied again
+        with open(os.path.join(repo_path, "new.py"), "w") as f:
+            f.write("print(2)")
+        third = GitMigEngine(self.source_dir, self.dest_dir, quiet=True, incremental=True)
+        third.run()
+        self.assertEqual(third.repos_unchanged, 0)
+
+    def test_incremental_recopies_edited_ignored_file(self):
+        """Test that --incremental notices an edit to a git-ignored file it copies."""
+        repo_path = os.path.join(self.source_dir, "repo1")
+        os.makedirs(repo_path)
+        for name, content in {"main.py": "print(1)", ".gitignore": "local.json\n", "local.json": '{"a":1}'}.items():
+            with open(os.path.join(repo_path, name), "w") as f:
+                f.write(content)
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q"], cwd=repo_path, check=True)
+        subprocess.run(git + ["add", "."], cwd=repo_path, check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=repo_path, check=True)
+        GitMigEngine(self.source_dir, self.dest_dir, quiet=True, incremental=True).run()
+
+        with open(os.path.join(repo_path, "local.json"), "w") as f:
+            f.write('{"a":2}')
+        second = GitMigEngine(self.source_dir, self.dest_dir, quiet=True, incremental=True)
+        second.run()
+
+        self.assertEqual(second.repos_unchanged, 0)
+        with open(os.path.join(self.dest_dir, "repo1", "local.json")) as f:
+            self.assertEqual(f.read(), '{"a":2}')
+
     def test_only_repos_filters(self):
         """Test that --only filters to specific repos."""
         self._create_repo("repo1", {"a.py": "# 1"})
@@ -471,6 +795,106 @@ class TestGitMigEngine(unittest.TestCase):
         self.assertEqual(engine2.files_skipped_existing, 1)
         self.assertEqual(engine2.files_overwritten, 0)
 
+    def test_skip_existing_recopies_changed_size(self):
+        """Test that --skip-existing recopies a file whose size differs at destination."""
+        self._create_repo("test_repo", {"file.txt": "content"})
+        dst_file = os.path.join(self.dest_dir, "test_repo", "file.txt")
+        os.makedirs(os.path.dirname(dst_file))
+        with open(dst_file, "w") as f:
+            f.write("cont")  # Truncated by an interrupted run
+
+        engine = GitMigEngine(self.source_dir, self.dest_dir, skip_existing=True, force=True)
+        files, _ = engine._scan_repo("test_repo")
+        engine._copy_repo("test_repo", files)
+
+        self.assertEqual(engine.files_skipped_existing, 0)
+        with open(dst_file) as f:
+            self.assertEqual(f.read(), "content")
+
+
+class TestEnginePureLogic(unittest.TestCase):
+    """Test GitMigEngine pattern checks that never touch the filesystem."""
+
+    # Nothing is created or read, so no temporary directories are needed
+    source_dir = os.path.join(os.sep, "nonexistent", "source")
+    dest_dir = os.path.join(os.sep, "nonexistent", "dest")
+
+    # =========================================================================
+    # Exclusion Tests
+    # =========================================================================
+
+    def test_should_exclude_dir_node_modules(self):
+        """Test that node_modules is excluded."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertTrue(engine._should_exclude_dir("node_modules"))
+
+    def test_should_exclude_dir_git(self):
+        """Test that .git is excluded by default."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertTrue(engine._should_exclude_dir(".git"))
+
+    def test_should_exclude_dir_with_include_git(self):
+        """Test that .git is NOT excluded when --include-git is set."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir, include_git=True)
+        self.assertFalse(engine._should_exclude_dir(".git"))
+
+    def test_should_exclude_dir_venv(self):
+        """Test that venv directories are excluded."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertTrue(engine._should_exclude_dir("venv"))
+        self.assertTrue(engine._should_exclude_dir(".venv"))
+
+    def test_should_exclude_file_log(self):
+        """Test that .log files are excluded."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertTrue(engine._should_exclude_file("debug.log"))
+        self.assertTrue(engine._should_exclude_file("app.log"))
+
+    def test_should_exclude_file_pyc(self):
+        """Test that .pyc files are excluded."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertTrue(engine._should_exclude_file("module.pyc"))
+
+    def test_should_not_exclude_source_files(self):
+        """Test that source files are NOT excluded."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertFalse(engine._should_exclude_file("main.py"))
+        self.assertFalse(engine._should_exclude_file("index.js"))
+        self.assertFalse(engine._should_exclude_file("README.md"))
+
+    def test_extra_excludes(self):
+        """Test custom exclusion patterns."""
+        engine = GitMigEngine(
+            self.source_dir, self.dest_dir, 
+            extra_excludes=["*.txt", "temp/"]
+        )
+        self.assertTrue(engine._should_exclude_file("notes.txt"))
+        self.assertTrue(engine._should_exclude_dir("temp"))
+
+    # =========================================================================
+    # Preservation Tests
+    # =========================================================================
+
+    def test_should_preserve_env_file(self):
+        """Test that .env files are preserved."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertTrue(engine._should_preserve(".env"))
+        self.assertTrue(engine._should_preserve(".env.local"))
+        self.assertTrue(engine._should_preserve(".env.production"))
+
+    def test_should_not_preserve_regular_files(self):
+        """Test that regular files are not marked for preservation."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir)
+        self.assertFalse(engine._should_preserve("main.py"))
+        self.assertFalse(engine._should_preserve("package.json"))
+
+    def test_classify_file_preserve_wins(self):
+        """Test that combined classification prefers preservation over exclusion."""
+        engine = GitMigEngine(self.source_dir, self.dest_dir, extra_excludes=[".env*"])
+        self.assertEqual(engine._classify_file(".env.local"), "preserve")
+        self.assertEqual(engine._classify_file("debug.log"), "exclude")
+        self.assertIsNone(engine._classify_file("main.py"))
+
 
 class TestConfig(unittest.TestCase):
     """Test the configuration module."""
@@ -493,6 +917,21 @@ class TestConfig(unittest.TestCase):
         self.assertIn(".env", PRESERVE_PATTERNS)
         self.assertIn(".env.*", PRESERVE_PATTERNS)
 
+    def test_compiled_patterns_match_config(self):
+        """Test that the precompiled sets and regexes cover literal and glob patterns."""
+        self.assertIn("node_modules", EXCLUDE_DIRS_LITERAL)
+        self.assertNotIn("*.egg-info", EXCLUDE_DIRS_LITERAL)
+        self.assertIsNotNone(EXCLUDE_DIRS_GLOB_RE.match("gitmig.egg-info"))
+        self.assertIsNotNone(EXCLUDE_FILE_RE.match("debug.log"))
+        self.assertIsNone(EXCLUDE_FILE_RE.match("main.py"))
+        self.assertIsNotNone(PRESERVE_RE.match(".env.local"))
+
+    def test_compile_patterns_suffix_prefilter(self):
+        """Test that glob suffixes are extracted only when every glob ends in literal text."""
+        self.assertEqual(compile_patterns(["*.egg-info", "build"])[1], (".egg-info",))
+        self.assertIsNone(compile_patterns(["*.log", "tmp*"])[1])
+        self.assertEqual(compile_patterns(["dist"]), (frozenset({"dist"}), None, None))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)